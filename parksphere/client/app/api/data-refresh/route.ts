@@ -9,81 +9,113 @@ const RATE_LIMITS = {
   nasa: { requests: 30, windowMs: 60 * 60 * 1000 },      // 30 per hour
 };
 
+// Both query params end up in filesystem paths under public/data, so
+// only known values are accepted - a raw parkCode like '../../x' must
+// never reach path.join
+const VALID_PARK_CODES = new Set([
+  'yose', 'grca', 'yell', 'grsm', 'zion',
+  'romo', 'acad', 'grte', 'olym', 'glac'
+]);
+const VALID_DATA_TYPES = new Set(['images', 'details', 'terrain']);
+
 // In-memory rate limit tracking (use Redis in production)
 const rateLimitTracker = new Map<string, { count: number; resetTime: number }>();
 
-async function checkRateLimit(service: string): Promise<boolean> {
+// One tracker lookup answers everything a caller needs - whether to
+// proceed, how long until the window resets, and how much budget is
+// left - instead of re-reading the map for each of those separately
+function consumeRateLimit(service: string):
+  | { allowed: true; remainingRequests: number }
+  | { allowed: false; retryAfter: number } {
   const now = Date.now();
   const limit = RATE_LIMITS[service as keyof typeof RATE_LIMITS];
-  
-  if (!limit) return true;
-  
+
+  if (!limit) return { allowed: true, remainingRequests: Infinity };
+
   const tracker = rateLimitTracker.get(service) || { count: 0, resetTime: now + limit.windowMs };
-  
+
   // Reset if window expired
   if (now > tracker.resetTime) {
     tracker.count = 0;
     tracker.resetTime = now + limit.windowMs;
   }
-  
+
   // Check if under limit
   if (tracker.count < limit.requests) {
     tracker.count++;
     rateLimitTracker.set(service, tracker);
-    return true;
+    return { allowed: true, remainingRequests: limit.requests - tracker.count };
   }
-  
-  return false;
+
+  return { allowed: false, retryAfter: Math.ceil((tracker.resetTime - now) / 1000) };
+}
+
+// Shared refresh logic, callable in-process. Both the GET handler and
+// the progressive background update go through here, so the background
+// job doesn't pay an HTTP round-trip (and JSON serialize/parse) to
+// talk to its own process.
+async function refreshParkData(parkCode: string, dataType: string) {
+  // Check which service we need based on data type
+  const service = dataType === 'images' ? 'unsplash' :
+                 dataType === 'terrain' ? 'nasa' : 'nps';
+
+  // Check rate limit
+  const rateLimit = consumeRateLimit(service);
+
+  if (!rateLimit.allowed) {
+    return { ok: false as const, retryAfter: rateLimit.retryAfter, service };
+  }
+
+  // Simulate API call (replace with actual API calls)
+  const mockData = await fetchDataFromAPI(parkCode, dataType);
+
+  // Update local cache
+  await updateLocalCache(parkCode, dataType, mockData);
+
+  return {
+    ok: true as const,
+    service,
+    remainingRequests: rateLimit.remainingRequests
+  };
 }
 
 export async function GET(request: Request) {
   const { searchParams } = new URL(request.url);
   const parkCode = searchParams.get('park');
   const dataType = searchParams.get('type'); // 'images', 'details', 'terrain'
-  
+
   if (!parkCode || !dataType) {
     return NextResponse.json({ error: 'Missing parameters' }, { status: 400 });
   }
-  
+
+  if (!VALID_PARK_CODES.has(parkCode) || !VALID_DATA_TYPES.has(dataType)) {
+    return NextResponse.json({ error: 'Invalid park or data type' }, { status: 400 });
+  }
+
   try {
-    // Check which service we need based on data type
-    const service = dataType === 'images' ? 'unsplash' : 
-                   dataType === 'terrain' ? 'nasa' : 'nps';
-    
-    // Check rate limit
-    const canProceed = await checkRateLimit(service);
-    
-    if (!canProceed) {
-      // Calculate time until rate limit resets
-      const tracker = rateLimitTracker.get(service);
-      const timeUntilReset = tracker ? Math.ceil((tracker.resetTime - Date.now()) / 1000) : 3600;
-      
+    const result = await refreshParkData(parkCode, dataType);
+
+    if (!result.ok) {
       return NextResponse.json({
         error: 'Rate limit exceeded',
-        retryAfter: timeUntilReset,
-        service
-      }, { 
+        retryAfter: result.retryAfter,
+        service: result.service
+      }, {
         status: 429,
         headers: {
-          'Retry-After': timeUntilReset.toString()
+          'Retry-After': result.retryAfter.toString()
         }
       });
     }
-    
-    // Simulate API call (replace with actual API calls)
-    const mockData = await fetchDataFromAPI(parkCode, dataType);
-    
-    // Update local cache
-    await updateLocalCache(parkCode, dataType, mockData);
-    
+
     return NextResponse.json({
       success: true,
       park: parkCode,
       dataType,
       timestamp: new Date().toISOString(),
-      remainingRequests: RATE_LIMITS[service as keyof typeof RATE_LIMITS].requests - (rateLimitTracker.get(service)?.count || 0)
+      remainingRequests: result.remainingRequests
     });
-    
+
   } catch (error) {
     console.error('Data refresh error:', error);
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 });
@@ -136,28 +168,28 @@ export async function POST(request: Request) {
 }
 
 async function startProgressiveUpdate() {
-  const parks = ['yose', 'grca', 'yell', 'grsm', 'zion', 'romo', 'acad', 'grte', 'olym', 'glac'];
-  const dataTypes = ['images', 'details', 'terrain'];
+  const parks = [...VALID_PARK_CODES];
+  const dataTypes = [...VALID_DATA_TYPES];
   
   for (const park of parks) {
     for (const dataType of dataTypes) {
       try {
-        // Make request to our own endpoint
-        const response = await fetch(`${process.env.NEXT_PUBLIC_URL || 'http://localhost:3000'}/api/data-refresh?park=${park}&type=${dataType}`);
-        
-        if (response.status === 429) {
+        // Call the shared refresh logic directly - no loopback HTTP
+        // request to our own server
+        const result = await refreshParkData(park, dataType);
+
+        if (!result.ok) {
           // Rate limited, wait and retry
-          const retryAfter = parseInt(response.headers.get('Retry-After') || '3600');
-          console.log(`Rate limited for ${park} ${dataType}, waiting ${retryAfter}s`);
-          await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
+          console.log(`Rate limited for ${park} ${dataType}, waiting ${result.retryAfter}s`);
+          await new Promise(resolve => setTimeout(resolve, result.retryAfter * 1000));
           continue;
         }
-        
+
         console.log(`Updated ${park} ${dataType}`);
-        
+
         // Small delay between requests
         await new Promise(resolve => setTimeout(resolve, 5000));
-        
+
       } catch (error) {
         console.error(`Failed to update ${park} ${dataType}:`, error);
       }
@@ -1,48 +1,6 @@
 import { NextResponse } from 'next/server';
 import { services } from '@/lib/services';
-
-interface EnrichedParkData {
-  seasons: {
-    spring: { weather: string; highlights: string[]; crowdLevel: string };
-    summer: { weather: string; highlights: string[]; crowdLevel: string };
-    fall: { weather: string; highlights: string[]; crowdLevel: string };
-    winter: { weather: string; highlights: string[]; crowdLevel: string };
-  };
-  bestTimeToVisit: string;
-  averageVisitors: {
-    annual: string;
-    peakMonth: string;
-    quietMonth: string;
-  };
-  busyHours: {
-    weekday: string;
-    weekend: string;
-    holidays: string;
-  };
-  wildlife: {
-    common: string[];
-    rare: string[];
-    bestViewingTimes: string;
-    safetyTips: string[];
-  };
-  popularTrails: {
-    beginner: { name: string; distance: string; highlights: string }[];
-    intermediate: { name: string; distance: string; highlights: string }[];
-    advanced: { name: string; distance: string; highlights: string }[];
-  };
-  localTips: string[];
-  photographySpots: {
-    sunrise: string[];
-    sunset: string[];
-    night: string[];
-  };
-  nearbyAttractions: string[];
-  parkingInfo: {
-    mainLots: string[];
-    alternativeParking: string[];
-    busyTimes: string;
-  };
-}
+import { EnrichedParkData } from '@/lib/types';
 
 const PARK_PROMPTS = {
   yose: "Yosemite National Park in California",
@@ -57,124 +15,65 @@ const PARK_PROMPTS = {
   glac: "Glacier National Park in Montana"
 };
 
+// Enriched data is effectively static per park, but every GET paid a
+// full model call to recompute it. Completed results are memoized
+// in-process with a TTL, so repeat requests for the same park are a
+// map lookup instead of an upstream round-trip.
+const ENRICH_CACHE_TTL_MS = 24 * 60 * 60 * 1000; // 24 hours
+const enrichCache = new Map<
+  string,
+  { expires: number; payload: { parkCode: string; enrichedData: EnrichedParkData; generated: string } }
+>();
+
+// Shared enrichment logic: both the single-park GET and the enrich-all
+// POST call this directly, so the batch path doesn't route through a
+// synthetic Request/Response pair per park
+async function enrichPark(parkCode: keyof typeof PARK_PROMPTS) {
+  const cached = enrichCache.get(parkCode);
+  if (cached && cached.expires > Date.now()) {
+    return cached.payload;
+  }
+
+  const enrichmentService = services.getEnrichmentService();
+  const enrichedDataRaw = await enrichmentService.enrichParkData(parkCode);
+
+  // The service requests json_object output and returns it parsed, so
+  // use the object directly - no re-stringify, markdown-stripping and
+  // re-parse of a payload that was never markdown to begin with
+  if (!enrichedDataRaw || Object.keys(enrichedDataRaw).length === 0) {
+    console.error('No response from AI.');
+    throw new Error('No response from AI');
+  }
+
+  const enrichedData = enrichedDataRaw as EnrichedParkData;
+
+  const payload = {
+    parkCode,
+    enrichedData,
+    generated: new Date().toISOString()
+  };
+  enrichCache.set(parkCode, { expires: Date.now() + ENRICH_CACHE_TTL_MS, payload });
+  return payload;
+}
+
 export async function GET(request: Request) {
   const { searchParams } = new URL(request.url);
   const parkCode = searchParams.get('park') as keyof typeof PARK_PROMPTS;
-  
+
   if (!parkCode || !PARK_PROMPTS[parkCode]) {
     return NextResponse.json({ error: 'Invalid park code' }, { status: 400 });
   }
 
   try {
-    const prompt = `You are a National Park expert. Provide detailed, accurate information about ${PARK_PROMPTS[parkCode]}.
-
-Return a JSON object with this exact structure (no markdown, just JSON):
-{
-  "seasons": {
-    "spring": {
-      "weather": "Temperature range and conditions",
-      "highlights": ["3-4 specific activities or sights"],
-      "crowdLevel": "Low/Moderate/High"
-    },
-    "summer": {
-      "weather": "Temperature range and conditions",
-      "highlights": ["3-4 specific activities or sights"],
-      "crowdLevel": "Low/Moderate/High"
-    },
-    "fall": {
-      "weather": "Temperature range and conditions",
-      "highlights": ["3-4 specific activities or sights"],
-      "crowdLevel": "Low/Moderate/High"
-    },
-    "winter": {
-      "weather": "Temperature range and conditions",
-      "highlights": ["3-4 specific activities or sights"],
-      "crowdLevel": "Low/Moderate/High"
-    }
-  },
-  "bestTimeToVisit": "Specific months and why",
-  "averageVisitors": {
-    "annual": "X million visitors",
-    "peakMonth": "Month - X visitors",
-    "quietMonth": "Month - X visitors"
-  },
-  "busyHours": {
-    "weekday": "9am-11am least busy, 2pm-4pm busiest",
-    "weekend": "Specific hours",
-    "holidays": "Specific advice"
-  },
-  "wildlife": {
-    "common": ["5-6 commonly seen animals"],
-    "rare": ["2-3 rare sightings"],
-    "bestViewingTimes": "Dawn and dusk in specific areas",
-    "safetyTips": ["3-4 specific safety tips"]
-  },
-  "popularTrails": {
-    "beginner": [
-      {"name": "Trail Name", "distance": "X miles", "highlights": "What you'll see"}
-    ],
-    "intermediate": [
-      {"name": "Trail Name", "distance": "X miles", "highlights": "What you'll see"}
-    ],
-    "advanced": [
-      {"name": "Trail Name", "distance": "X miles", "highlights": "What you'll see"}
-    ]
-  },
-  "localTips": ["5 insider tips from locals"],
-  "photographySpots": {
-    "sunrise": ["2-3 specific locations"],
-    "sunset": ["2-3 specific locations"],
-    "night": ["1-2 spots for astrophotography"]
-  },
-  "nearbyAttractions": ["3-4 attractions within 30 miles"],
-  "parkingInfo": {
-    "mainLots": ["Names of main parking areas"],
-    "alternativeParking": ["Overflow or alternative options"],
-    "busyTimes": "Specific times when parking is hardest"
-  }
-}`;
-
-    const enrichmentService = services.getEnrichmentService();
-    const enrichedDataRaw = await enrichmentService.enrichParkData(parkCode);
-    
-    // The service returns parsed JSON, so we need to validate it matches our expected structure
-    const response = JSON.stringify(enrichedDataRaw);
-    if (!response) {
-      console.error('No response from AI.');
-      throw new Error('No response from AI');
-    }
-    
-    console.log(`AI response for ${parkCode} (first 200 chars):`, response.substring(0, 200));
-
-    // Parse the JSON response
-    let enrichedData: EnrichedParkData;
-    try {
-      // Remove any markdown code blocks if present
-      let cleanJson = response.replace(/```json\n?/g, '').replace(/```\n?/g, '').trim();
-      
-      // Try to find JSON object in the response
-      const jsonStart = cleanJson.indexOf('{');
-      const jsonEnd = cleanJson.lastIndexOf('}');
-      if (jsonStart !== -1 && jsonEnd !== -1) {
-        cleanJson = cleanJson.substring(jsonStart, jsonEnd + 1);
-      }
-      
-      enrichedData = JSON.parse(cleanJson);
-    } catch (parseError) {
-      console.error('Failed to parse AI response:', response);
-      console.error('Parse error:', parseError);
-      throw new Error('Invalid JSON response from AI');
-    }
-
-    return NextResponse.json({
-      parkCode,
-      enrichedData,
-      generated: new Date().toISOString()
+    // Enriched data changes at most daily, so let browsers and any CDN
+    // in front of the deployment reuse responses instead of hitting
+    // this route (and its in-process cache) for every page view
+    return NextResponse.json(await enrichPark(parkCode), {
+      headers: { 'Cache-Control': 'public, max-age=300, stale-while-revalidate=3600' }
     });
-
   } catch (error) {
     console.error('Enrichment error:', error);
-    return NextResponse.json({ 
+    return NextResponse.json({
       error: 'Failed to enrich park data',
       details: error instanceof Error ? error.message : 'Unknown error'
     }, { status: 500 });
@@ -183,40 +82,54 @@ Return a JSON object with this exact structure (no markdown, just JSON):
 
 // Endpoint to enrich all parks
 export async function POST(request: Request) {
-  const parks = Object.keys(PARK_PROMPTS);
-  const results = [];
-  
-  for (const parkCode of parks) {
-    try {
-      console.log(`Enriching data for ${parkCode}...`);
-      
-      // Call the GET method directly instead of making HTTP request
-      const url = new URL(request.url);
-      url.searchParams.set('park', parkCode);
-      const getResponse = await GET(new Request(url.toString()));
-      const data = await getResponse.json();
-      
-      if (getResponse.ok) {
-        results.push({ parkCode, status: 'success', data });
-      } else {
-        results.push({ parkCode, status: 'error', error: data.error });
-      }
-      
-      // Rate limit: wait 2 seconds between requests
-      await new Promise(resolve => setTimeout(resolve, 2000));
-      
-    } catch (error) {
-      results.push({ 
-        parkCode, 
-        status: 'error', 
-        error: error instanceof Error ? error.message : 'Unknown error' 
-      });
+  const parks = Object.keys(PARK_PROMPTS) as (keyof typeof PARK_PROMPTS)[];
+
+  // Stream results as newline-delimited JSON. The batch takes minutes;
+  // buffering it meant the caller saw nothing until the last park
+  // finished and every payload sat in memory at once. Each line ships
+  // as its park completes (completion order, not input order).
+  const encoder = new TextEncoder();
+  const stream = new ReadableStream({
+    async start(controller) {
+      // Parks are independent, so keep a few enrichments in flight;
+      // the per-worker delay keeps the aggregate request rate polite
+      // to the upstream API
+      const concurrency = 3;
+      let next = 0;
+
+      const worker = async () => {
+        while (next < parks.length) {
+          const parkCode = parks[next++];
+          let result;
+          try {
+            console.log(`Enriching data for ${parkCode}...`);
+            const data = await enrichPark(parkCode);
+            result = { parkCode, status: 'success', data };
+          } catch (error) {
+            result = {
+              parkCode,
+              status: 'error',
+              error: error instanceof Error ? error.message : 'Unknown error'
+            };
+          }
+          controller.enqueue(encoder.encode(JSON.stringify(result) + '\n'));
+
+          // Rate limit: wait 2 seconds between requests
+          await new Promise(resolve => setTimeout(resolve, 2000));
+        }
+      };
+
+      await Promise.all(Array.from({ length: concurrency }, worker));
+
+      controller.enqueue(encoder.encode(JSON.stringify({
+        message: 'Enrichment complete',
+        timestamp: new Date().toISOString()
+      }) + '\n'));
+      controller.close();
     }
-  }
-  
-  return NextResponse.json({
-    message: 'Enrichment complete',
-    results,
-    timestamp: new Date().toISOString()
   });
-}
\ No newline at end of file
+
+  return new Response(stream, {
+    headers: { 'Content-Type': 'application/x-ndjson' }
+  });
+}
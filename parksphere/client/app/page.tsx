@@ -3,6 +3,7 @@
 import { useEffect, useState } from 'react';
 import dynamic from 'next/dynamic';
 import { Park, Trail } from '@/lib/types';
+import { loadParks } from '@/lib/parksData';
 
 // Dynamically import RealisticEarthGlobe to avoid SSR issues with Three.js
 const RealisticEarthGlobe = dynamic(() => import('@/components/RealisticEarthGlobe'), { 
@@ -56,6 +57,15 @@ const InstructionBar = dynamic(() => import('@/components/InstructionBar'), {
 
 // Static data - no API needed
 
+// Trail badge styles are static; hoisted so the panel doesn't rebuild
+// the record for every trail on every render
+const DIFFICULTY_COLORS: Record<Trail['difficulty'], string> = {
+  easy: 'text-green-400 bg-green-500/20',
+  moderate: 'text-yellow-400 bg-yellow-500/20',
+  hard: 'text-orange-400 bg-orange-500/20',
+  expert: 'text-red-400 bg-red-500/20'
+};
+
 // Floating park info panel component
 function ParkInfoPanel({ park, onClose, onShowTrails }: { park: Park; onClose: () => void; onShowTrails?: () => void }) {
   const [selectedImage, setSelectedImage] = useState<number | null>(null);
@@ -162,18 +172,11 @@ function ParkInfoPanel({ park, onClose, onShowTrails }: { park: Park; onClose: (
             </h3>
             <div className="space-y-2">
               {park.trails.slice(0, 3).map((trail) => {
-                const difficultyColors = {
-                  easy: 'text-green-400 bg-green-500/20',
-                  moderate: 'text-yellow-400 bg-yellow-500/20',
-                  hard: 'text-orange-400 bg-orange-500/20',
-                  expert: 'text-red-400 bg-red-500/20'
-                };
-                
                 return (
                   <div key={trail.id} className="bg-white/5 rounded-lg p-3">
                     <div className="flex items-start justify-between mb-1">
                       <h4 className="font-medium text-white text-sm">{trail.name}</h4>
-                      <span className={`px-2 py-0.5 rounded-full text-xs ${difficultyColors[trail.difficulty]}`}>
+                      <span className={`px-2 py-0.5 rounded-full text-xs ${DIFFICULTY_COLORS[trail.difficulty]}`}>
                         {trail.difficulty}
                       </span>
                     </div>
@@ -300,10 +303,8 @@ export default function Home() {
   const [hasMoreParks, setHasMoreParks] = useState(true);
   const BATCH_SIZE = 10; // Increased for 200 parks
   useEffect(() => {
-    console.log('[MOUNT] Component mounting...');
     setMounted(true);
-    console.log('[MOUNT] Calling fetchParks...');
-    
+
     // Call fetchParks immediately
     fetchParks();
     
@@ -338,60 +339,33 @@ export default function Home() {
     
     // Simulate network delay for progressive feel
     setTimeout(() => {
-      const start = currentBatch * BATCH_SIZE;
-      const end = start + BATCH_SIZE;
-      const nextBatch = allParksData.slice(start, end);
-      
-      console.log('[PROGRESSIVE] Loading batch', currentBatch + 1, '- parks', start, 'to', end);
-      
-      // Add new parks to existing ones
-      setParks(prev => [...prev, ...nextBatch]);
-      setFilteredParks(prev => [...prev, ...nextBatch]);
-      
+      const end = (currentBatch + 1) * BATCH_SIZE;
+      // One slice of the full dataset per batch instead of re-spreading
+      // the accumulated arrays - growing a list by copy-append makes
+      // each batch pay for every park loaded so far
+      const visible = allParksData.slice(0, end);
+
+      setParks(visible);
+      setFilteredParks(visible);
+
       // Update batch counter
       setCurrentBatch(prev => prev + 1);
-      
+
       // Check if we have more parks to load
       setHasMoreParks(end < allParksData.length);
       setIsLoadingMore(false);
-      
-      console.log('[PROGRESSIVE] Now showing', parks.length + nextBatch.length, 'of', allParksData.length, 'parks');
     }, 500); // 500ms delay for smooth UX
   };
 
   const fetchParks = async () => {
     try {
-      console.log('[1] Starting fetchParks...');
       setError(null); // Clear any previous errors
       
-      console.log('[2] Fetching /data/parks.json...');
-      const url = '/data/parks.json';
-      console.log('[2b] Full URL:', window.location.origin + url);
-      const response = await fetch(url);
-      
-      console.log('[3] Response received:', { 
-        status: response.status, 
-        ok: response.ok,
-        headers: response.headers
-      });
-      
-      if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-      }
-      
-      console.log('[4] Parsing JSON...');
-      const data = await response.json();
-      
-      console.log('[5] Data parsed:', { 
-        hasData: !!data,
-        hasParks: !!data?.parks,
-        parksLength: data?.parks?.length || 0
-      });
-      
-      const parksData = data.parks || data;
-      
-      console.log('[6] Setting state with', parksData.length, 'parks');
-      
+      // Shared loader: the search panel reads the same dataset, so the
+      // fetch and parse happen once per session regardless of who asks
+      // first
+      const parksData = await loadParks();
+
       // Store all parks data but only show first batch
       setAllParksData(parksData);
       
@@ -401,13 +375,10 @@ export default function Home() {
       setFilteredParks(firstBatch);
       setCurrentBatch(1);
       setHasMoreParks(parksData.length > BATCH_SIZE);
-      
-      console.log('[7] Progressive loading initialized - showing', firstBatch.length, 'of', parksData.length, 'parks');
     } catch (err) {
-      console.error('[ERROR] fetchParks failed:', err);
+      console.error('Failed to fetch parks:', err);
       setError(err instanceof Error ? err.message : 'Failed to load parks');
     } finally {
-      console.log('[8] Setting loading to false');
       setLoading(false);
     }
   };
@@ -444,27 +415,20 @@ export default function Home() {
   };
 
   const handleFilterChange = (filters: any) => {
-    // Filter from currently loaded parks
-    let filtered = [...parks];
+    // Filter the loaded parks in one pass. Set membership replaces the
+    // nested Array.includes scans, so each park is tested against the
+    // selected biomes/activities in constant time per entry.
+    const biomes = new Set<string>(filters.biomes);
+    const activities = new Set<string>(filters.activities);
 
-    // Filter by biomes
-    if (filters.biomes.length > 0) {
-      filtered = filtered.filter(park => filters.biomes.includes(park.biome));
-    }
-
-    // Filter by activities
-    if (filters.activities.length > 0) {
-      filtered = filtered.filter(park => 
-        park.activities && filters.activities.some((activity: string) => 
-          park.activities.includes(activity)
-        )
-      );
-    }
+    const filtered = parks.filter(park =>
+      (biomes.size === 0 || biomes.has(park.biome)) &&
+      (activities.size === 0 ||
+        (park.activities !== undefined &&
+          park.activities.some(activity => activities.has(activity))))
+    );
 
     setFilteredParks(filtered);
-    
-    // Log filter status
-    console.log('[FILTER] Applied filters - showing', filtered.length, 'of', parks.length, 'loaded parks');
   };
 
   return (
@@ -1,7 +1,7 @@
 'use client';
 
 import { useState, useEffect } from 'react';
-import { Park } from '@/lib/types';
+import { EnrichedParkData, Park } from '@/lib/types';
 import { 
   Calendar, Clock, Users, Camera, Car, TreePine, 
   Sunrise, Sunset, Moon, AlertTriangle, MapPin,
@@ -10,18 +10,33 @@ import {
 
 interface EnhancedParkInfoProps {
   park: Park;
-  enrichedData?: any;
+  enrichedData?: EnrichedParkData;
   onClose: () => void;
 }
 
+// Enriched data is stable for a session, but the panel remounts every
+// time a park is opened - without this cache each reopen repeated the
+// API round-trip for data the session already has
+const enrichedCache = new Map<string, EnrichedParkData>();
+
 export default function EnhancedParkInfo({ park, enrichedData, onClose }: EnhancedParkInfoProps) {
   const [activeTab, setActiveTab] = useState<'overview' | 'seasons' | 'wildlife' | 'trails' | 'tips'>('overview');
-  const [loading, setLoading] = useState(!enrichedData);
-  const [data, setData] = useState(enrichedData);
+  const initialData = enrichedData || enrichedCache.get(park.code);
+  const [loading, setLoading] = useState(!initialData);
+  const [data, setData] = useState<EnrichedParkData | undefined>(initialData);
   const hasMascot = park.mascot !== undefined;
 
+  // The panel stays mounted while the selected park changes, so sync
+  // state here on every park switch: apply the cached payload on a
+  // hit, and clear the previous park's data before fetching on a miss
   useEffect(() => {
-    if (!enrichedData) {
+    const cached = enrichedData || enrichedCache.get(park.code);
+    if (cached) {
+      setData(cached);
+      setLoading(false);
+    } else {
+      setData(undefined);
+      setLoading(true);
       fetchEnrichedData();
     }
   }, [park.code]);
@@ -30,8 +45,9 @@ export default function EnhancedParkInfo({ park, enrichedData, onClose }: Enhanc
     try {
       const response = await fetch(`/api/enrich-park-data?park=${park.code}`);
       const result = await response.json();
-      
+
       if (response.ok) {
+        enrichedCache.set(park.code, result.enrichedData);
         setData(result.enrichedData);
       }
     } catch (error) {
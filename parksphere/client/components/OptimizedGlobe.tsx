@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useRef, useState } from 'react';
+import { useEffect, useMemo, useRef, useState } from 'react';
 import * as THREE from 'three';
 import { GlobeEngine } from '@/src/engine/GlobeEngine';
 import { Park } from '@/lib/types';
@@ -32,6 +32,13 @@ export default function OptimizedGlobe({
   const [fps, setFps] = useState<number>(0);
   const [selectedParkForTerrain, setSelectedParkForTerrain] = useState<Park | null>(null);
 
+  // Index parks by id once per dataset; the selection effect looks
+  // parks up by id, and a map get beats a linear scan per selection
+  const parksById = useMemo(
+    () => new Map(parks.map(park => [park.id, park])),
+    [parks]
+  );
+
   useEffect(() => {
     if (!canvasRef.current) return;
 
@@ -147,7 +154,7 @@ export default function OptimizedGlobe({
         });
       } else {
         // Find park and fly to it
-        const park = parks.find(p => p.id === selectedParkId);
+        const park = parksById.get(selectedParkId);
         if (park) {
           engineRef.current.flyTo(park, {
             duration: 2000,
@@ -161,7 +168,7 @@ export default function OptimizedGlobe({
         }
       }
     }
-  }, [selectedParkId, parks]);
+  }, [selectedParkId, parksById]);
 
   if (loading) {
     return (
@@ -2,6 +2,7 @@
 
 import { useState, useEffect, useRef } from 'react';
 import { Park } from '@/lib/types';
+import { loadParks } from '@/lib/parksData';
 import { Search, X, MapPin, Trees, Globe } from 'lucide-react';
 
 interface SearchPanelProps {
@@ -15,7 +16,10 @@ export default function SearchPanel({ onParkSelect, isOpen, onClose }: SearchPan
   const [results, setResults] = useState<Park[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const [allParks, setAllParks] = useState<Park[]>([]);
+  // Each entry pairs a park with a prebuilt lowercase haystack so a
+  // keystroke scans one string per park instead of lowercasing every
+  // field (and activity) on each search
+  const [searchIndex, setSearchIndex] = useState<{ park: Park; haystack: string }[]>([]);
   const inputRef = useRef<HTMLInputElement>(null);
   const searchTimeout = useRef<NodeJS.Timeout | null>(null);
 
@@ -27,16 +31,20 @@ export default function SearchPanel({ onParkSelect, isOpen, onClose }: SearchPan
 
   // Load all parks data once
   useEffect(() => {
-    const loadParks = async () => {
+    const buildIndex = async () => {
       try {
-        const response = await fetch('/data/parks.json');
-        const data = await response.json();
-        setAllParks(data.parks || data);
+        const parks = await loadParks();
+        setSearchIndex(parks.map(park => ({
+          park,
+          haystack: [park.name, park.country, park.biome, ...(park.activities || [])]
+            .join(' ')
+            .toLowerCase()
+        })));
       } catch (err) {
         console.error('Failed to load parks data:', err);
       }
     };
-    loadParks();
+    buildIndex();
   }, []);
 
   useEffect(() => {
@@ -59,24 +67,19 @@ export default function SearchPanel({ onParkSelect, isOpen, onClose }: SearchPan
         clearTimeout(searchTimeout.current);
       }
     };
-  }, [query, allParks]);
+  }, [query, searchIndex]);
 
   const performSearch = async () => {
     setLoading(true);
     setError(null);
 
     try {
-      // Client-side search
+      // Client-side search over the precomputed haystacks
       const searchQuery = query.toLowerCase();
-      const filtered = allParks.filter(park => 
-        park.name.toLowerCase().includes(searchQuery) ||
-        park.country.toLowerCase().includes(searchQuery) ||
-        park.biome.toLowerCase().includes(searchQuery) ||
-        (park.activities && park.activities.some(activity => 
-          activity.toLowerCase().includes(searchQuery)
-        ))
-      );
-      
+      const filtered = searchIndex
+        .filter(entry => entry.haystack.includes(searchQuery))
+        .map(entry => entry.park);
+
       setResults(filtered);
     } catch (err) {
       setError('Failed to search parks');
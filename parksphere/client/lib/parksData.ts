@@ -0,0 +1,29 @@
+// Shared in-memory parks dataset
+// parks.json is static per deploy, but each component that needed it
+// issued its own fetch and kept its own copy. Loading it once through
+// this module gives every consumer the same promise (and the same
+// parsed array), so the network and JSON.parse cost is paid once per
+// session.
+
+import { Park } from './types';
+
+let parksPromise: Promise<Park[]> | null = null;
+
+export function loadParks(): Promise<Park[]> {
+  if (!parksPromise) {
+    parksPromise = fetch('/data/parks.json')
+      .then(response => {
+        if (!response.ok) {
+          throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        return response.json();
+      })
+      .then(data => data.parks || data)
+      .catch(error => {
+        // Drop the failed promise so the next caller retries the fetch
+        parksPromise = null;
+        throw error;
+      });
+  }
+  return parksPromise;
+}
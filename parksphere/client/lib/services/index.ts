@@ -97,42 +97,23 @@ class GroqMascotService implements MascotService {
   }
 }
 
-class GroqEnrichmentService implements EnrichmentService {
-  private client: Groq | null = null;
-
-  private getClient(): Groq {
-    if (!this.client) {
-      const config = getConfig();
-      if (!config.api.groqKey) {
-        throw new Error('GROQ_API_KEY is not configured');
-      }
-      this.client = new Groq({ apiKey: config.api.groqKey });
-    }
-    return this.client;
-  }
-
-  async enrichParkData(parkCode: string): Promise<any> {
-    const client = this.getClient();
-    
-    const parkNames: Record<string, string> = {
-      yose: "Yosemite National Park in California",
-      grca: "Grand Canyon National Park in Arizona",
-      yell: "Yellowstone National Park in Wyoming",
-      grsm: "Great Smoky Mountains National Park in Tennessee/North Carolina",
-      zion: "Zion National Park in Utah",
-      romo: "Rocky Mountain National Park in Colorado",
-      acad: "Acadia National Park in Maine",
-      grte: "Grand Teton National Park in Wyoming",
-      olym: "Olympic National Park in Washington",
-      glac: "Glacier National Park in Montana"
-    };
-    
-    const parkName = parkNames[parkCode] || `${parkCode} National Park`;
-    
-    const prompt = `You are a National Park expert. Provide detailed, accurate information about ${parkName}.
-
-Return a JSON object with this exact structure (no markdown, just JSON):
-{
+// Static lookup + prompt scaffolding for enrichment. These were
+// rebuilt inside every enrichParkData call; as module constants they
+// are allocated once per process.
+const ENRICHMENT_PARK_NAMES: Record<string, string> = {
+  yose: "Yosemite National Park in California",
+  grca: "Grand Canyon National Park in Arizona",
+  yell: "Yellowstone National Park in Wyoming",
+  grsm: "Great Smoky Mountains National Park in Tennessee/North Carolina",
+  zion: "Zion National Park in Utah",
+  romo: "Rocky Mountain National Park in Colorado",
+  acad: "Acadia National Park in Maine",
+  grte: "Grand Teton National Park in Wyoming",
+  olym: "Olympic National Park in Washington",
+  glac: "Glacier National Park in Montana"
+};
+
+const ENRICHMENT_JSON_STRUCTURE = `{
   "seasons": {
     "spring": {
       "weather": "Temperature range and conditions",
@@ -196,6 +177,30 @@ Return a JSON object with this exact structure (no markdown, just JSON):
     "busyTimes": "Specific times when parking is hardest"
   }
 }`;
+
+class GroqEnrichmentService implements EnrichmentService {
+  private client: Groq | null = null;
+
+  private getClient(): Groq {
+    if (!this.client) {
+      const config = getConfig();
+      if (!config.api.groqKey) {
+        throw new Error('GROQ_API_KEY is not configured');
+      }
+      this.client = new Groq({ apiKey: config.api.groqKey });
+    }
+    return this.client;
+  }
+
+  async enrichParkData(parkCode: string): Promise<any> {
+    const client = this.getClient();
+
+    const parkName = ENRICHMENT_PARK_NAMES[parkCode] || `${parkCode} National Park`;
+
+    const prompt = `You are a National Park expert. Provide detailed, accurate information about ${parkName}.
+
+Return a JSON object with this exact structure (no markdown, just JSON):
+${ENRICHMENT_JSON_STRUCTURE}`;
     
     const completion = await client.chat.completions.create({
       messages: [{
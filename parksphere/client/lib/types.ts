@@ -5,7 +5,10 @@ export interface Coordinates {
 
 export interface GalleryImage {
   url: string;
-  blur: string;
+  /** Legacy base64 data-URI placeholder; superseded by blurHash */
+  blur?: string;
+  /** Compact BlurHash placeholder string (~30 chars) */
+  blurHash?: string;
   attribution?: string;
 }
 
@@ -28,6 +31,55 @@ export interface Trail {
   description: string;
 }
 
+// Enriched visitor data produced by the enrich-park-data route. The
+// shape is shared by the route, the Park model and the info panel so
+// the three stay in sync without per-consumer copies.
+export interface EnrichedParkData {
+  seasons: {
+    [key: string]: {
+      weather: string;
+      highlights: string[];
+      crowdLevel: string;
+    };
+  };
+  bestTimeToVisit: string;
+  averageVisitors: {
+    annual: string;
+    peakMonth: string;
+    quietMonth: string;
+  };
+  busyHours: {
+    weekday: string;
+    weekend: string;
+    holidays: string;
+  };
+  wildlife: {
+    common: string[];
+    rare: string[];
+    bestViewingTimes: string;
+    safetyTips: string[];
+  };
+  popularTrails: {
+    [level: string]: Array<{
+      name: string;
+      distance: string;
+      highlights: string;
+    }>;
+  };
+  localTips: string[];
+  photographySpots: {
+    sunrise: string[];
+    sunset: string[];
+    night: string[];
+  };
+  nearbyAttractions: string[];
+  parkingInfo: {
+    mainLots: string[];
+    alternativeParking: string[];
+    busyTimes: string;
+  };
+}
+
 export interface Park {
   id: number;
   name: string;
@@ -46,49 +98,5 @@ export interface Park {
   nasa_validated?: boolean;
   mascot?: ParkMascot;
   trails?: Trail[];
-  enrichedData?: {
-    seasons: {
-      [key: string]: {
-        weather: string;
-        highlights: string[];
-        crowdLevel: string;
-      };
-    };
-    bestTimeToVisit: string;
-    averageVisitors: {
-      annual: string;
-      peakMonth: string;
-      quietMonth: string;
-    };
-    busyHours: {
-      weekday: string;
-      weekend: string;
-      holidays: string;
-    };
-    wildlife: {
-      common: string[];
-      rare: string[];
-      bestViewingTimes: string;
-      safetyTips: string[];
-    };
-    popularTrails: {
-      [level: string]: Array<{
-        name: string;
-        distance: string;
-        highlights: string;
-      }>;
-    };
-    localTips: string[];
-    photographySpots: {
-      sunrise: string[];
-      sunset: string[];
-      night: string[];
-    };
-    nearbyAttractions: string[];
-    parkingInfo: {
-      mainLots: string[];
-      alternativeParking: string[];
-      busyTimes: string;
-    };
-  };
+  enrichedData?: EnrichedParkData;
 }
\ No newline at end of file
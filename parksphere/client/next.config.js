@@ -16,7 +16,33 @@ const nextConfig = {
         hostname: 'eoimages.gsfc.nasa.gov',
       },
     ],
-  }
+  },
+  // The park data and imagery under public/ only change at deploy
+  // time, but without explicit headers every visit re-downloads them.
+  // Long-lived caching lets repeat reads come straight from the
+  // browser/CDN cache instead of the server.
+  async headers() {
+    return [
+      {
+        source: '/data/:path*',
+        headers: [
+          {
+            key: 'Cache-Control',
+            value: 'public, max-age=3600, stale-while-revalidate=86400',
+          },
+        ],
+      },
+      {
+        source: '/images/:path*',
+        headers: [
+          {
+            key: 'Cache-Control',
+            value: 'public, max-age=86400, stale-while-revalidate=604800',
+          },
+        ],
+      },
+    ];
+  },
 }
 
 module.exports = nextConfig
\ No newline at end of file
@@ -38,6 +38,7 @@ export interface ParkData {
 export interface DataManifest {
   version: string;
   generated: string;
+  parkIndex?: Record<string, number>;
   parks: ParkData[];
 }
 
@@ -129,7 +130,6 @@ export class DataLoader {
     }
     
     // Fallback to procedural terrain
-    console.log(`Creating procedural terrain for park ${parkId} at LOD ${lod}`);
     const proceduralGeometry = this.createProceduralTerrain(parkId, lod);
     this.cache.set(cacheKey, proceduralGeometry);
     return proceduralGeometry;
@@ -152,10 +152,7 @@ export class DataLoader {
           
           resolve(geometry);
         },
-        (progress) => {
-          const percent = (progress.loaded / progress.total) * 100;
-          console.log(`Loading terrain ${parkId} LOD${lod}: ${percent.toFixed(0)}%`);
-        },
+        undefined,
         (error) => {
           console.warn(`Failed to load terrain file for ${parkId} LOD${lod}, will use procedural terrain`);
           resolve(null);
@@ -300,7 +297,23 @@ export class DataLoader {
     if (this.cache.has(cacheKey)) {
       return this.cache.get(cacheKey);
     }
-    
+
+    // The manifest already lists every park's texture URLs, so one
+    // manifest fetch answers this for all parks - no per-park
+    // textures.json request on the hot path
+    // Older manifests (and the error fallback) carry no parks array,
+    // so guard every step and fall through to textures.json rather
+    // than throwing on a missing entry
+    const manifest = await this.loadManifest();
+    const index = manifest.parkIndex?.[parkId];
+    const entry = index !== undefined
+      ? manifest.parks?.[index]
+      : manifest.parks?.find(p => p.id === parkId);
+    if (entry?.textures && typeof entry.textures.satellite === 'string') {
+      this.cache.set(cacheKey, entry.textures);
+      return entry.textures;
+    }
+
     try {
       const response = await fetch(`/data/parks/${parkId}/textures.json`);
       const info = await response.json();
@@ -316,8 +329,6 @@ export class DataLoader {
    * Preload all assets for a park
    */
   public async preloadPark(parkId: string): Promise<void> {
-    console.log(`Preloading assets for ${parkId}...`);
-    
     // Load all LODs in parallel
     const terrainPromises = [0, 1, 2, 3].map(lod => 
       this.loadTerrain(parkId, lod as 0 | 1 | 2 | 3)
@@ -329,8 +340,6 @@ export class DataLoader {
       this.loadParkTextures(parkId),
       ...terrainPromises
     ]);
-    
-    console.log(`Preloading complete for ${parkId}`);
   }
   
   /**
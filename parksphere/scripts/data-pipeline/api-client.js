@@ -2,6 +2,14 @@
 // Handles all external API integrations with rate limiting
 
 import axios from 'axios';
+import http from 'http';
+import https from 'https';
+import os from 'os';
+import path from 'path';
+import { createHash } from 'crypto';
+import { createWriteStream } from 'fs';
+import fsp from 'fs/promises';
+import { pipeline } from 'stream/promises';
 import dotenv from 'dotenv';
 import { RateLimiter } from './rate-limiter.js';
 
@@ -9,6 +17,15 @@ dotenv.config();
 
 class APIClient {
   constructor() {
+    // Shared HTTP client with keep-alive agents: reuses TCP+TLS
+    // connections across requests to the same host instead of paying
+    // a fresh handshake for every small JSON call
+    this.http = axios.create({
+      httpAgent: new http.Agent({ keepAlive: true, maxSockets: 16 }),
+      httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 16 }),
+      timeout: 30000
+    });
+
     // Initialize rate limiters for each API
     this.rateLimiters = {
       nps: new RateLimiter(10, 3600000), // 10 requests per hour
@@ -37,11 +54,48 @@ class APIClient {
     };
   }
 
+  /**
+   * Short stable filename fragment for a URL. BLAKE2b rather than MD5:
+   * faster in software and not a deprecated algorithm; 8 hex chars is
+   * plenty for temp-file uniqueness.
+   */
+  urlSlug(url) {
+    return createHash('blake2b512').update(url).digest('hex').slice(0, 8);
+  }
+
+  /**
+   * Stream a binary download straight to disk instead of buffering the
+   * whole body in memory. Large satellite images (tens of MB) would
+   * otherwise double peak memory and limit download concurrency.
+   *
+   * Streams to a .part path and renames on success so a run killed
+   * mid-download never leaves a truncated file at the final path - the
+   * skip-if-present checks treat anything at destPath as complete.
+   */
+  async downloadToFile(url, destPath, options = {}) {
+    const partPath = `${destPath}.part`;
+    const response = await this.http.get(url, {
+      ...options,
+      responseType: 'stream'
+    });
+    try {
+      await pipeline(
+        response.data,
+        createWriteStream(partPath, { highWaterMark: 64 * 1024 })
+      );
+    } catch (error) {
+      await fsp.rm(partPath, { force: true });
+      throw error;
+    }
+    await fsp.rename(partPath, destPath);
+    return destPath;
+  }
+
   async fetchNPSData(parkCode) {
     await this.rateLimiters.nps.waitForToken();
     
     try {
-      const response = await axios.get(`${this.apis.nps.baseURL}/parks`, {
+      const response = await this.http.get(`${this.apis.nps.baseURL}/parks`, {
         params: {
           parkCode: parkCode,
           api_key: this.apis.nps.apiKey,
@@ -83,7 +137,7 @@ class APIClient {
     
     try {
       // USGS National Elevation Dataset (NED) endpoint
-      const response = await axios.get(
+      const response = await this.http.get(
         `${this.apis.usgs.baseURL}/3DEPElevation/ImageServer/exportImage`,
         {
           params: {
@@ -100,16 +154,20 @@ class APIClient {
         }
       );
       
-      // Process elevation data
+      // Stream the elevation raster to a temp file - at 10 m
+      // resolution a park-sized F32 TIFF runs to tens of MB, which
+      // otherwise sits in RAM as one arraybuffer per park
       if (response.data.href) {
-        const elevationResponse = await axios.get(response.data.href, {
-          responseType: 'arraybuffer'
-        });
-        
+        const dataPath = path.join(
+          os.tmpdir(),
+          `usgs-${this.urlSlug(response.data.href)}.tiff`
+        );
+        await this.downloadToFile(response.data.href, dataPath);
+
         return {
           bounds,
           resolution,
-          data: elevationResponse.data,
+          dataPath,
           format: 'tiff'
         };
       }
@@ -129,42 +187,64 @@ class APIClient {
     const centerLat = (north + south) / 2;
     const centerLon = (east + west) / 2;
     
+    const params = {
+      lon: centerLon,
+      lat: centerLat,
+      date: '2023-01-01', // Get recent imagery
+      dim: 0.15, // Width/height in degrees
+      api_key: this.apis.nasa.apiKey
+    };
+
     try {
-      // NASA Earth Imagery API
-      const response = await axios.get(`${this.apis.nasa.baseURL}/planetary/earth/assets`, {
-        params: {
-          lon: centerLon,
-          lat: centerLat,
-          date: '2023-01-01', // Get recent imagery
-          dim: 0.15, // Width/height in degrees
-          api_key: this.apis.nasa.apiKey
-        }
-      });
-      
+      // The assets lookup and the imagery endpoint take the same
+      // coordinates, so fire both at once instead of paying two
+      // sequential round-trips per park. If assets comes back empty the
+      // speculative download is discarded - rare, and free on a cache
+      // hit.
+      const imageryUrl = `${this.apis.nasa.baseURL}/planetary/earth/imagery`;
+      const imagePath = path.join(
+        os.tmpdir(),
+        `nasa-${this.urlSlug(imageryUrl + JSON.stringify(params))}.jpg`
+      );
+      const alreadyDownloaded = await fsp.stat(imagePath)
+        .then(stats => stats.size > 0)
+        .catch(() => false);
+
+      const imageryPromise = alreadyDownloaded
+        ? Promise.resolve(imagePath)
+        : this.downloadToFile(imageryUrl, imagePath, { params });
+      // Keep a failed download from surfacing as an unhandled rejection
+      // while the assets response is still pending; the await below
+      // rethrows the real error
+      imageryPromise.catch(() => {});
+
+      const response = await this.http.get(
+        `${this.apis.nasa.baseURL}/planetary/earth/assets`,
+        { params }
+      );
+
       if (response.data.url) {
-        // Fetch the actual image
-        const imageResponse = await axios.get(response.data.url, {
-          responseType: 'arraybuffer',
-          params: {
-            api_key: this.apis.nasa.apiKey
-          }
-        });
-        
+        await imageryPromise;
+
         return {
-          imageData: imageResponse.data,
+          imagePath,
           date: response.data.date,
           url: response.data.url,
           id: response.data.id,
           cloudScore: response.data.cloud_score || 0
         };
       }
-      
+
+      // No usable scene: drop whatever the speculative download wrote
+      await imageryPromise.catch(() => {});
+      await fsp.rm(imagePath, { force: true });
+
       throw new Error('No imagery available');
     } catch (error) {
       console.error(`NASA API error:`, error.message);
       // Return placeholder data
       return {
-        imageData: null,
+        imagePath: null,
         date: new Date().toISOString(),
         url: `/placeholder/satellite-${parkName.toLowerCase().replace(/ /g, '-')}.jpg`,
         cloudScore: 0
@@ -177,7 +257,7 @@ class APIClient {
     
     try {
       // Search for the park
-      const searchResponse = await axios.get(this.apis.wikipedia.baseURL, {
+      const searchResponse = await this.http.get(this.apis.wikipedia.baseURL, {
         params: {
           action: 'query',
           format: 'json',
@@ -191,7 +271,7 @@ class APIClient {
         const pageId = searchResponse.data.query.search[0].pageid;
         
         // Get page content
-        const contentResponse = await axios.get(this.apis.wikipedia.baseURL, {
+        const contentResponse = await this.http.get(this.apis.wikipedia.baseURL, {
           params: {
             action: 'query',
             format: 'json',
@@ -6,14 +6,23 @@
  */
 
 import fs from 'fs/promises';
+import os from 'os';
 import path from 'path';
 import { fileURLToPath } from 'url';
-import generateStaticData from './generate-static-data.js';
+import generateStaticData, { writeDerivedIndexes, writeFileAtomic } from './generate-static-data.js';
 import generateTerrainData from './generate-terrain-data.js';
 import TextureProcessor from './texture-processor.js';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
+// libuv's worker pool defaults to 4 threads, so the build's concurrent
+// file writes and hashing serialize four at a time on bigger machines.
+// Size it to the host before the first async fs call spins the pool
+// up; an explicit UV_THREADPOOL_SIZE in the environment still wins.
+if (!process.env.UV_THREADPOOL_SIZE) {
+  process.env.UV_THREADPOOL_SIZE = String(Math.max(4, os.cpus().length));
+}
+
 const PARKS = [
   'yose', 'grca', 'yell', 'grsm', 'zion',
   'romo', 'acad', 'grte', 'olym', 'glac'
@@ -29,40 +38,67 @@ async function buildAllData() {
   console.log('  - Gallery images\n');
   
   const startTime = Date.now();
+  // A single timestamp for the run keeps the manifest and build report
+  // in agreement about when this build happened
+  const buildTimestamp = new Date().toISOString();
   
   try {
-    // Step 1: Generate static park data
+    // Step 1: Generate static park data (kept in memory for later
+    // steps). Index generation is deferred to after gallery
+    // enrichment - building indexes before the bulk work finishes
+    // just means rebuilding them.
     console.log('\n📊 Step 1: Generating static park data...');
-    await generateStaticData();
+    const parks = await generateStaticData({ writeIndexes: false });
     
     // Step 2: Generate terrain data
     console.log('\n🏔️  Step 2: Generating terrain data...');
-    await generateTerrainData();
+    await generateTerrainData(buildTimestamp);
     
     // Step 3: Generate textures and gallery images
     console.log('\n🎨 Step 3: Generating textures and gallery images...');
     const textureProcessor = new TextureProcessor();
     
-    for (const parkId of PARKS) {
-      console.log(`\nProcessing images for ${parkId}...`);
-      
-      // Generate textures
-      await textureProcessor.processTextures(parkId);
-      
-      // Generate gallery images
-      const galleryImages = await textureProcessor.generateGalleryImages(parkId, 5);
-      
-      // Update park data with gallery images
-      await updateParkGallery(parkId, galleryImages);
-    }
-    
+    // Parks are independent; process a few at a time. sharp's encode
+    // work runs on libvips' own thread pool, so overlapping parks
+    // parallelizes the CPU-bound image work too.
+    const galleries = {};
+    const concurrency = 3;
+    let next = 0;
+
+    const imageWorker = async () => {
+      while (next < PARKS.length) {
+        const parkId = PARKS[next++];
+        console.log(`\nProcessing images for ${parkId}...`);
+
+        // Generate textures
+        await textureProcessor.processTextures(parkId);
+
+        // Generate gallery images
+        galleries[parkId] = await textureProcessor.generateGalleryImages(parkId, 5);
+      }
+    };
+
+    await Promise.all(Array.from({ length: concurrency }, imageWorker));
+
+    // Apply all gallery updates to the in-memory parks and write
+    // parks.json once instead of a full re-serialize per park
+    await updateParkGalleries(galleries, parks);
+
+    // Now that the park data is final, build the search index and
+    // manifest from it in one pass
+    await writeDerivedIndexes(
+      parks,
+      path.join(__dirname, '../../client/public/data'),
+      buildTimestamp
+    );
+
     // Step 4: Generate final manifest
     console.log('\n📋 Step 4: Updating final manifest...');
-    await updateFinalManifest();
+    await updateFinalManifest(buildTimestamp);
     
     // Step 5: Generate build report
     console.log('\n📈 Step 5: Generating build report...');
-    await generateBuildReport();
+    await generateBuildReport(buildTimestamp);
     
     const endTime = Date.now();
     const duration = (endTime - startTime) / 1000;
@@ -76,29 +112,27 @@ async function buildAllData() {
   }
 }
 
-async function updateParkGallery(parkId, galleryImages) {
+async function updateParkGalleries(galleries, parks) {
   const parksJsonPath = path.join(__dirname, '../../client/public/data/parks.json');
-  
-  // Read current parks data
-  const parksData = JSON.parse(await fs.readFile(parksJsonPath, 'utf-8'));
-  
-  // Find park by code
-  const park = parksData.parks.find(p => p.code === parkId);
-  if (park) {
-    park.gallery = galleryImages;
+
+  // The parks array is still in memory from step 1 - no re-read needed
+  for (const park of parks) {
+    if (galleries[park.code]) {
+      park.gallery = galleries[park.code];
+    }
   }
-  
-  // Write updated data
-  await fs.writeFile(parksJsonPath, JSON.stringify(parksData, null, 2));
+
+  // Write updated data once
+  await writeFileAtomic(parksJsonPath, JSON.stringify({ parks }));
 }
 
-async function updateFinalManifest() {
+async function updateFinalManifest(buildTimestamp) {
   const manifestPath = path.join(__dirname, '../../client/public/data/manifest.json');
   const manifest = JSON.parse(await fs.readFile(manifestPath, 'utf-8'));
   
   // Add build metadata
   manifest.build = {
-    timestamp: new Date().toISOString(),
+    timestamp: buildTimestamp,
     version: '1.0.0',
     environment: process.env.NODE_ENV || 'development'
   };
@@ -114,10 +148,10 @@ async function updateFinalManifest() {
     }
   }
   
-  await fs.writeFile(manifestPath, JSON.stringify(manifest, null, 2));
+  await writeFileAtomic(manifestPath, JSON.stringify(manifest));
 }
 
-async function generateBuildReport() {
+async function generateBuildReport(buildTimestamp) {
   const reportPath = path.join(__dirname, '../../client/public/data/build-report.json');
   const dataDir = path.join(__dirname, '../../client/public/data');
   
@@ -171,7 +205,7 @@ async function generateBuildReport() {
   }
   
   const report = {
-    generated: new Date().toISOString(),
+    generated: buildTimestamp,
     dataSize: {
       totalMB: (sizes.total / 1024 / 1024).toFixed(2),
       byPark: Object.entries(sizes.parks).reduce((acc, [id, size]) => {
@@ -0,0 +1,796 @@
+/**
+ * Generate Earth Textures for the Globe
+ * Developer 1: Data Pipeline
+ *
+ * Produces the /textures/earth_*.jpg files consumed by the Earth shader
+ * (see client/src/engine/EarthMesh.ts). Several of the committed texture
+ * files are empty placeholders; this script fills them procedurally.
+ */
+
+import sharp from 'sharp';
+import axios from 'axios';
+import fs from 'fs/promises';
+import http from 'http';
+import https from 'https';
+import path from 'path';
+import { createWriteStream } from 'fs';
+import { pipeline } from 'stream/promises';
+import { fileURLToPath } from 'url';
+import { Worker, isMainThread, parentPort, workerData } from 'worker_threads';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+
+// All source textures come from the same NASA host, so a keep-alive
+// client reuses one TLS connection across the downloads (and their
+// mirror retries) instead of handshaking per URL
+const downloadClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true }),
+  httpsAgent: new https.Agent({ keepAlive: true })
+});
+
+const TEXTURE_DIR = path.join(__dirname, '../../client/public/textures');
+
+// Base resolution for generated textures (2:1 equirectangular)
+const WIDTH = 4096;
+const HEIGHT = 2048;
+
+// Continents as ellipses (center/radii as image fractions) - far less
+// blocky than the old axis-aligned rectangles
+const CONTINENT_ELLIPSES = [
+  { cx: 0.20, cy: 0.30, rx: 0.10, ry: 0.15, color: [85, 107, 47] },    // North America
+  { cx: 0.28, cy: 0.62, rx: 0.05, ry: 0.17, color: [34, 139, 34] },    // South America
+  { cx: 0.51, cy: 0.27, rx: 0.06, ry: 0.12, color: [107, 142, 35] },   // Europe
+  { cx: 0.53, cy: 0.50, rx: 0.09, ry: 0.20, color: [189, 183, 107] },  // Africa
+  { cx: 0.72, cy: 0.30, rx: 0.15, ry: 0.20, color: [160, 140, 90] },   // Asia
+  { cx: 0.86, cy: 0.69, rx: 0.06, ry: 0.09, color: [205, 170, 125] }   // Australia
+];
+
+// Seeded PRNG (mulberry32) so texture builds are reproducible: the
+// same seed yields byte-identical output in every worker and on every
+// machine, which keeps the generated JPEGs stable across rebuilds. It
+// is also a few multiplies per draw - cheaper than Math.random's
+// xorshift128+ path through the engine.
+function mulberry32(seed) {
+  let state = seed >>> 0;
+  return function random() {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const random = mulberry32(0x9e3779b9);
+
+// Pregenerated texture noise, reused cyclically. Prime length so the
+// reuse never lines up with row boundaries and shows banding.
+const NOISE_SIZE = 1021;
+const NOISE_TABLE = new Float32Array(NOISE_SIZE);
+for (let i = 0; i < NOISE_SIZE; i++) {
+  NOISE_TABLE[i] = (random() - 0.5) * 24;
+}
+
+const OCEAN_COLOR = [25, 65, 120];
+
+/**
+ * Paint the continent ellipses into a day-texture buffer. Kept as a
+ * standalone kernel over plain numbers and the module-level noise
+ * table: no per-iteration allocation, no closure captures, and a
+ * wrapping counter instead of a modulo in the hot loop, so V8 can keep
+ * the whole thing monomorphic and optimized.
+ */
+function paintContinents(day) {
+  let ni = 0;
+  for (let e = 0; e < CONTINENT_ELLIPSES.length; e++) {
+    const ellipse = CONTINENT_ELLIPSES[e];
+    const r = ellipse.color[0];
+    const g = ellipse.color[1];
+    const b = ellipse.color[2];
+    const ecx = ellipse.cx * WIDTH;
+    const ecy = ellipse.cy * HEIGHT;
+    const erx = ellipse.rx * WIDTH;
+    const ery = ellipse.ry * HEIGHT;
+
+    const yStart = Math.max(0, Math.ceil(ecy - ery));
+    const yEnd = Math.min(HEIGHT, Math.floor(ecy + ery));
+
+    for (let y = yStart; y < yEnd; y++) {
+      const nyr = (y - ecy) / ery;
+      const halfSpan = erx * Math.sqrt(1 - nyr * nyr);
+      const xStart = Math.max(0, Math.round(ecx - halfSpan));
+      const xEnd = Math.min(WIDTH, Math.round(ecx + halfSpan));
+
+      let idx = (y * WIDTH + xStart) * 3;
+      for (let x = xStart; x < xEnd; x++) {
+        const n = NOISE_TABLE[ni];
+        ni = ni + 1 === NOISE_SIZE ? 0 : ni + 1;
+        day[idx++] = r + n;
+        day[idx++] = g + n;
+        day[idx++] = b + n;
+      }
+    }
+  }
+}
+
+/**
+ * Generate the daylight texture: ocean base with a latitude gradient,
+ * continents from the ellipse table, and polar ice.
+ */
+function createDayTexture() {
+  console.log('  🗺️  Generating day texture...');
+
+  const day = Buffer.alloc(WIDTH * HEIGHT * 3);
+
+  // Ocean base with a latitude gradient: equatorial water is warmer
+  // and brighter than polar water. The per-row color is computed once
+  // and written with a C-level pattern fill, so no per-pixel JS loop.
+  const rowColor = Buffer.alloc(3);
+  for (let y = 0; y < HEIGHT; y++) {
+    const lat = 90 - (y / HEIGHT) * 180;
+    const c = Math.cos(lat * (Math.PI / 180));
+    rowColor[0] = OCEAN_COLOR[0] + 20 * c;
+    rowColor[1] = OCEAN_COLOR[1] + 30 * c;
+    rowColor[2] = OCEAN_COLOR[2] + 20 * c;
+    day.fill(rowColor, y * WIDTH * 3, (y + 1) * WIDTH * 3);
+  }
+
+  paintContinents(day);
+
+  // Antarctica: a solid ice sheet across the bottom rows, written as
+  // one pattern fill
+  const ice = Buffer.from([250, 250, 255]);
+  day.fill(ice, Math.floor(HEIGHT * 0.92) * WIDTH * 3);
+
+  // Arctic: broken pack ice, coverage thinning toward open water
+  const arcticRows = Math.floor(HEIGHT * 0.06);
+  for (let y = 0; y < arcticRows; y++) {
+    const coverage = 0.85 - (y / arcticRows) * 0.5;
+    let idx = y * WIDTH * 3;
+    for (let x = 0; x < WIDTH; x++, idx += 3) {
+      if (random() < coverage) {
+        day[idx] = 240;
+        day[idx + 1] = 248;
+        day[idx + 2] = 255;
+      }
+    }
+  }
+
+  // A light sigma~1.5 pass softens the hard coastline and pack-ice
+  // edges so they do not shimmer when the globe rotates
+  smoothTexture(day, 3, 1.5);
+
+  return day;
+}
+
+// Major cities for the night-lights texture: [lat, lon, brightness 0-1]
+const CITIES = [
+  [40.7, -74.0, 1.0],   // New York
+  [34.0, -118.2, 0.9],  // Los Angeles
+  [41.9, -87.6, 0.8],   // Chicago
+  [51.5, -0.1, 1.0],    // London
+  [48.9, 2.3, 0.9],     // Paris
+  [52.5, 13.4, 0.8],    // Berlin
+  [55.8, 37.6, 0.8],    // Moscow
+  [35.7, 139.7, 1.0],   // Tokyo
+  [31.2, 121.5, 0.9],   // Shanghai
+  [39.9, 116.4, 0.9],   // Beijing
+  [28.6, 77.2, 0.8],    // Delhi
+  [19.1, 72.9, 0.8],    // Mumbai
+  [-23.6, -46.6, 0.8],  // São Paulo
+  [-34.6, -58.4, 0.7],  // Buenos Aires
+  [19.4, -99.1, 0.8],   // Mexico City
+  [30.0, 31.2, 0.7],    // Cairo
+  [6.5, 3.4, 0.6],      // Lagos
+  [-33.9, 151.2, 0.7],  // Sydney
+  [1.35, 103.8, 0.8],   // Singapore
+  [25.3, 55.3, 0.7]     // Dubai
+];
+
+// Radius of the city glow halo in pixels. At 4096x2048 a metro area
+// spans tens of pixels, so the halo is a broad disk, not a dot.
+const HALO_RADIUS = 50;
+
+/**
+ * Rasterize the continent ellipses into a binary land mask using the
+ * same per-row span solve as the day texture. The mask is pure
+ * geometry - identical for every texture - so it is computed once per
+ * module instance and shared by the night, specular, and normal
+ * builders (it is read-only after this).
+ */
+let landMaskCache = null;
+
+function rasterizeLandMask() {
+  if (landMaskCache !== null) {
+    return landMaskCache;
+  }
+  const mask = new Uint8Array(WIDTH * HEIGHT);
+
+  for (const { cx, cy, rx, ry } of CONTINENT_ELLIPSES) {
+    const ecx = cx * WIDTH;
+    const ecy = cy * HEIGHT;
+    const erx = rx * WIDTH;
+    const ery = ry * HEIGHT;
+
+    const yStart = Math.max(0, Math.ceil(ecy - ery));
+    const yEnd = Math.min(HEIGHT, Math.floor(ecy + ery));
+
+    for (let y = yStart; y < yEnd; y++) {
+      const nyr = (y - ecy) / ery;
+      const halfSpan = erx * Math.sqrt(1 - nyr * nyr);
+      const xStart = Math.max(0, Math.round(ecx - halfSpan));
+      const xEnd = Math.min(WIDTH, Math.round(ecx + halfSpan));
+      mask.fill(1, y * WIDTH + xStart, y * WIDTH + xEnd);
+    }
+  }
+
+  landMaskCache = mask;
+  return mask;
+}
+
+/**
+ * One binary dilation step (4-neighborhood). Apply twice for "within
+ * 2 pixels of land".
+ */
+function dilateMask(mask) {
+  const out = new Uint8Array(mask.length);
+  for (let y = 0; y < HEIGHT; y++) {
+    const row = y * WIDTH;
+    for (let x = 0; x < WIDTH; x++) {
+      const i = row + x;
+      if (
+        mask[i] ||
+        (x > 0 && mask[i - 1]) ||
+        (x < WIDTH - 1 && mask[i + 1]) ||
+        (y > 0 && mask[i - WIDTH]) ||
+        (y < HEIGHT - 1 && mask[i + WIDTH])
+      ) {
+        out[i] = 1;
+      }
+    }
+  }
+  return out;
+}
+
+function latLonToPixel(lat, lon, width, height) {
+  const x = Math.floor(((lon + 180) / 360) * width);
+  const y = Math.floor(((90 - lat) / 180) * height);
+  return [x, y];
+}
+
+/**
+ * Generate the night-side texture: dark earth with warm city glows.
+ * Each city is stamped as a single bright impulse and the halos come
+ * from one shared Gaussian pass over the whole frame.
+ */
+function createNightTexture() {
+  console.log('  🌃 Generating night lights...');
+
+  // Accumulate glow brightness without clamping - overlapping halos
+  // just add - then clamp once when composing the RGB output. The
+  // shared plane may hold stale data, so zero it before accumulating.
+  const glow = planeScratch(WIDTH * HEIGHT);
+  glow.fill(0);
+
+  // Impulse + blur: one separable Gaussian diffuses every city at once,
+  // so the cost is a fixed three passes over the frame no matter how
+  // many cities are in the table, versus ~10k stamped pixels per city
+  for (const [lat, lon, brightness] of CITIES) {
+    const [cx, cy] = latLonToPixel(lat, lon, WIDTH, HEIGHT);
+    glow[cy * WIDTH + cx] += brightness;
+  }
+  gaussianApprox(glow, WIDTH, HEIGHT, HALO_RADIUS / 3);
+
+  // The blur spreads each unit impulse over ~sigma^2 pixels; rescale
+  // so the brightest metro peaks at full intensity again
+  let peak = 0;
+  for (let i = 0; i < glow.length; i++) {
+    if (glow[i] > peak) peak = glow[i];
+  }
+  const gain = peak > 0 ? 1 / peak : 0;
+  for (let i = 0; i < glow.length; i++) {
+    glow[i] *= gain;
+  }
+
+  // Coastal settlement lights: dilate the land mask twice to find the
+  // shoreline band (within 2 px of land) instead of testing a 5x5
+  // neighborhood around every pixel, then sprinkle faint lights there
+  const land = rasterizeLandMask();
+  const nearLand = dilateMask(dilateMask(land));
+  for (let i = 0; i < glow.length; i++) {
+    if (nearLand[i] && !land[i] && random() > 0.7) {
+      glow[i] += 0.12;
+    }
+  }
+
+  // Compose: faint blue ambient plus warm sodium-lamp tint (R > G > B),
+  // with per-pixel jitter from the noise table so lit areas look
+  // granular rather than airbrushed
+  const night = Buffer.alloc(WIDTH * HEIGHT * 3);
+  let ni = 0;
+  for (let i = 0; i < glow.length; i++) {
+    const jitter = 1 + NOISE_TABLE[ni] / 60;
+    ni = ni + 1 === NOISE_SIZE ? 0 : ni + 1;
+    const g = glow[i] * jitter * 255;
+    const idx = i * 3;
+    night[idx] = Math.min(255, 2 + g);
+    night[idx + 1] = Math.min(255, 2 + g * 0.75);
+    night[idx + 2] = Math.min(255, 8 + g * 0.25);
+  }
+
+  return night;
+}
+
+/**
+ * One horizontal box-blur pass over a single-channel Float32Array,
+ * implemented as a running sum: O(W*H) regardless of radius.
+ */
+function boxBlurHorizontal(src, dst, width, height, radius) {
+  const span = radius * 2 + 1;
+  for (let y = 0; y < height; y++) {
+    const row = y * width;
+    let sum = 0;
+    for (let x = -radius; x <= radius; x++) {
+      sum += src[row + Math.min(width - 1, Math.max(0, x))];
+    }
+    for (let x = 0; x < width; x++) {
+      dst[row + x] = sum / span;
+      const add = Math.min(width - 1, x + radius + 1);
+      const drop = Math.max(0, x - radius);
+      sum += src[row + add] - src[row + drop];
+    }
+  }
+}
+
+/**
+ * Vertical counterpart of boxBlurHorizontal.
+ */
+function boxBlurVertical(src, dst, width, height, radius) {
+  const span = radius * 2 + 1;
+  for (let x = 0; x < width; x++) {
+    let sum = 0;
+    for (let y = -radius; y <= radius; y++) {
+      sum += src[Math.min(height - 1, Math.max(0, y)) * width + x];
+    }
+    for (let y = 0; y < height; y++) {
+      dst[y * width + x] = sum / span;
+      const add = Math.min(height - 1, y + radius + 1);
+      const drop = Math.max(0, y - radius);
+      sum += src[add * width + x] - src[drop * width + x];
+    }
+  }
+}
+
+/**
+ * Approximate a Gaussian blur with three separable box-blur passes
+ * (radius chosen so 3 passes ~ the requested sigma). Each pass is a
+ * pure running-sum stream over memory, so the cost is independent of
+ * the blur radius.
+ */
+function gaussianApprox(channel, width, height, sigma) {
+  const radius = Math.max(1, Math.round(sigma * Math.sqrt(12 / 3) / 2));
+  let a = channel;
+  let b = blurScratch(channel.length);
+  for (let pass = 0; pass < 3; pass++) {
+    boxBlurHorizontal(a, b, width, height, radius);
+    boxBlurVertical(b, a, width, height, radius);
+  }
+  return a;
+}
+
+// Every full-resolution blur needs the same WIDTH*HEIGHT float plane,
+// so the ping-pong buffer and the channel plane are allocated once and
+// reused across calls rather than churning ~33 MB of fresh Float32
+// garbage per pass. Each worker thread gets its own module instance,
+// so there is no cross-thread aliasing.
+let blurScratchBuf = null;
+let planeScratchBuf = null;
+
+function blurScratch(length) {
+  if (blurScratchBuf === null || blurScratchBuf.length !== length) {
+    blurScratchBuf = new Float32Array(length);
+  }
+  return blurScratchBuf;
+}
+
+function planeScratch(length) {
+  if (planeScratchBuf === null || planeScratchBuf.length !== length) {
+    planeScratchBuf = new Float32Array(length);
+  }
+  return planeScratchBuf;
+}
+
+/**
+ * Smooth an interleaved uint8 texture in place by blurring each
+ * channel as a float32 plane with the running-sum Gaussian. Working in
+ * single-precision planes halves memory traffic versus a float64 copy
+ * of the whole interleaved image, and the box-blur passes keep cost
+ * independent of sigma.
+ */
+function smoothTexture(pixels, channels, sigma) {
+  const plane = planeScratch(WIDTH * HEIGHT);
+  for (let c = 0; c < channels; c++) {
+    for (let i = 0; i < plane.length; i++) {
+      plane[i] = pixels[i * channels + c];
+    }
+    const blurred = gaussianApprox(plane, WIDTH, HEIGHT, sigma);
+    for (let i = 0; i < plane.length; i++) {
+      pixels[i * channels + c] = blurred[i];
+    }
+  }
+}
+
+/**
+ * Generate the specular (ocean reflectivity) map: bright water, dark
+ * land, heavily smoothed so coastlines catch sun glints softly.
+ */
+function createSpecularTexture() {
+  console.log('  ✨ Generating specular map...');
+
+  // Water reflects, land doesn't: one branchless pass over the same
+  // land mask the other textures use, instead of a separate coarse
+  // rect approximation of the continents
+  const land = rasterizeLandMask();
+  // Borrow the shared channel plane rather than allocating another
+  // full-resolution float buffer just to feed the blur
+  const spec = planeScratch(WIDTH * HEIGHT);
+  for (let i = 0; i < spec.length; i++) {
+    spec[i] = land[i] ? 20 : 180;
+  }
+
+  const smoothed = gaussianApprox(spec, WIDTH, HEIGHT, 20);
+
+  const out = Buffer.alloc(WIDTH * HEIGHT * 3);
+  for (let i = 0; i < smoothed.length; i++) {
+    const v = smoothed[i] > 255 ? 255 : smoothed[i] | 0;
+    out[i * 3] = v;
+    out[i * 3 + 1] = v;
+    out[i * 3 + 2] = v;
+  }
+  return out;
+}
+
+// Major mountain ranges as image-fraction rects, intersected with the
+// land mask when painting relief
+const MOUNTAIN_RANGES = [
+  { x: 0.15, y: 0.26, w: 0.04, h: 0.16 },  // Rockies
+  { x: 0.265, y: 0.58, w: 0.025, h: 0.20 }, // Andes
+  { x: 0.505, y: 0.29, w: 0.035, h: 0.04 }, // Alps
+  { x: 0.66, y: 0.37, w: 0.09, h: 0.05 }    // Himalaya
+];
+
+/**
+ * Generate the normal map: flat up-facing normals everywhere, with
+ * noisy slope perturbations inside the mountain-range rects. Random
+ * values come from the pregenerated noise table rather than per-pixel
+ * generator calls, and each rect only touches its own bounding box.
+ */
+function createNormalTexture() {
+  console.log('  ⛰️  Generating normal map...');
+
+  const normal = Buffer.alloc(WIDTH * HEIGHT * 3);
+  // Flat normal (0,0,1) encodes to RGB(128,128,255): one pattern fill
+  normal.fill(Buffer.from([128, 128, 255]));
+
+  const land = rasterizeLandMask();
+
+  let ni = 0;
+  for (const range of MOUNTAIN_RANGES) {
+    const xStart = Math.floor(range.x * WIDTH);
+    const xEnd = Math.min(WIDTH, Math.floor((range.x + range.w) * WIDTH));
+    const yStart = Math.floor(range.y * HEIGHT);
+    const yEnd = Math.min(HEIGHT, Math.floor((range.y + range.h) * HEIGHT));
+
+    for (let y = yStart; y < yEnd; y++) {
+      const row = y * WIDTH;
+      for (let x = xStart; x < xEnd; x++) {
+        if (!land[row + x]) continue;
+
+        // Noise table entries are +/-12; scaled to ~+/-30 channel units
+        const nx = NOISE_TABLE[ni++ % NOISE_SIZE] * 2.5;
+        const nyv = NOISE_TABLE[ni++ % NOISE_SIZE] * 2.5;
+
+        const idx = (row + x) * 3;
+        normal[idx] = Math.max(0, Math.min(255, 128 + nx));
+        normal[idx + 1] = Math.max(0, Math.min(255, 128 + nyv));
+        normal[idx + 2] = 200;
+      }
+    }
+  }
+
+  return normal;
+}
+
+/**
+ * Generate the cloud layer as an RGBA buffer.
+ *
+ * Instead of stamping individual elliptical blobs (O(clouds x area) and
+ * visually blocky), synthesize one value-noise field: a coarse random
+ * grid upsampled bilinearly, smoothed with the box-blur Gaussian, then
+ * thresholded into cloud alpha. One O(pixels) pass, better clouds.
+ */
+function createCloudsTexture() {
+  console.log('  ☁️  Generating cloud layer...');
+
+  // Coarse random grid at 1/4 resolution
+  const gw = WIDTH / 4;
+  const gh = HEIGHT / 4;
+  const coarse = new Float32Array(gw * gh);
+  for (let i = 0; i < coarse.length; i++) {
+    coarse[i] = random();
+  }
+
+  // Bilinear upsample to full resolution; longitude wraps at the seam.
+  // Column indices and fractional weights only depend on x, so compute
+  // them once into lookup tables instead of re-deriving them for every
+  // one of the 2048 rows.
+  const colLeft = new Int32Array(WIDTH);
+  const colRight = new Int32Array(WIDTH);
+  const colFrac = new Float32Array(WIDTH);
+  for (let x = 0; x < WIDTH; x++) {
+    const gx = x / 4;
+    colLeft[x] = gx | 0;
+    colRight[x] = (colLeft[x] + 1) % gw;
+    colFrac[x] = gx - colLeft[x];
+  }
+
+  // Fully overwritten by the upsample below, so the shared plane can
+  // be borrowed without zeroing
+  const field = planeScratch(WIDTH * HEIGHT);
+  for (let y = 0; y < HEIGHT; y++) {
+    const gy = y / 4;
+    const y0 = Math.min(gh - 1, gy | 0);
+    const y1 = Math.min(gh - 1, y0 + 1);
+    const fy = gy - y0;
+    const rowTop = y0 * gw;
+    const rowBottom = y1 * gw;
+
+    for (let x = 0; x < WIDTH; x++) {
+      const fx = colFrac[x];
+      const top = coarse[rowTop + colLeft[x]] * (1 - fx) + coarse[rowTop + colRight[x]] * fx;
+      const bottom = coarse[rowBottom + colLeft[x]] * (1 - fx) + coarse[rowBottom + colRight[x]] * fx;
+      field[y * WIDTH + x] = top * (1 - fy) + bottom * fy;
+    }
+  }
+
+  // Smooth into billowy shapes, then threshold into alpha
+  const smoothed = gaussianApprox(field, WIDTH, HEIGHT, 8);
+
+  const clouds = Buffer.alloc(WIDTH * HEIGHT * 4);
+  for (let i = 0; i < smoothed.length; i++) {
+    const a = (smoothed[i] - 0.55) * 600;
+    const idx = i * 4;
+    clouds[idx] = 255;
+    clouds[idx + 1] = 255;
+    clouds[idx + 2] = 255;
+    clouds[idx + 3] = a <= 0 ? 0 : a >= 255 ? 255 : a;
+  }
+
+  return clouds;
+}
+
+// Real NASA source imagery per texture, best candidate first; lower
+// resolution mirrors follow so a moved or timed-out primary URL still
+// beats falling all the way back to the procedural builders
+const TEXTURE_SOURCES = {
+  day: [
+    'https://eoimages.gsfc.nasa.gov/images/imagerecords/73000/73909/world.topo.bathy.200412.3x5400x2700.jpg',
+    'https://eoimages.gsfc.nasa.gov/images/imagerecords/57000/57752/land_ocean_ice_2048.jpg'
+  ],
+  night: [
+    'https://eoimages.gsfc.nasa.gov/images/imagerecords/144000/144898/BlackMarble_2016_01deg.jpg',
+    'https://eoimages.gsfc.nasa.gov/images/imagerecords/79000/79765/dnb_land_ocean_ice.2012.3600x1800.jpg'
+  ],
+  clouds: [
+    'https://eoimages.gsfc.nasa.gov/images/imagerecords/57000/57747/cloud_combined_2048.jpg'
+  ]
+};
+
+const TEXTURE_FILES = {
+  day: 'earth_day.jpg',
+  night: 'earth_night.jpg',
+  clouds: 'earth_clouds.jpg',
+  specular: 'earth_specular.jpg',
+  normal: 'earth_normal.jpg'
+};
+
+// Explicit JPEG encoder settings per texture instead of one default.
+// The color maps take 4:2:0 chroma subsampling (half the chroma DCT
+// work, invisible on photographic content); the normal map is vector
+// data, where chroma error shows up as lighting artifacts, so it stays
+// 4:4:4. Progressive and mozjpeg are off: both add extra Huffman
+// passes over 4096x2048 frames, and these files are rebuilt often.
+const JPEG_OPTIONS = {
+  day: { quality: 95, chromaSubsampling: '4:2:0', progressive: false },
+  night: { quality: 90, chromaSubsampling: '4:2:0', progressive: false },
+  clouds: { quality: 90, chromaSubsampling: '4:2:0', progressive: false },
+  specular: { quality: 85, chromaSubsampling: '4:2:0', progressive: false },
+  normal: { quality: 95, chromaSubsampling: '4:4:4', progressive: false }
+};
+
+async function downloadTexture(name, urls) {
+  const dest = path.join(TEXTURE_DIR, TEXTURE_FILES[name]);
+  const srcPath = `${dest}.src`;
+  let lastError;
+  // URL fallback stays inside the per-texture task, so one texture
+  // retrying its mirror never serializes the others
+  for (const url of urls) {
+    try {
+      const response = await downloadClient.get(url, {
+        responseType: 'stream',
+        timeout: 120000
+      });
+      // A 1 MiB write buffer keeps the copy loop in large chunks
+      // instead of the 16 KiB default
+      await pipeline(
+        response.data,
+        createWriteStream(srcPath, { highWaterMark: 1024 * 1024 })
+      );
+      // Normalize to the shader's expected resolution. Sources range
+      // from 2048px to 5400px wide; the resample runs in libvips'
+      // SIMD/multithreaded pipeline and never upscales, so a
+      // lower-resolution mirror passes through cheaply.
+      await sharp(srcPath)
+        .resize(WIDTH, HEIGHT, { fit: 'fill', withoutEnlargement: true })
+        .jpeg(JPEG_OPTIONS[name])
+        .toFile(dest);
+      await fs.unlink(srcPath);
+      console.log(`  ⬇️  Downloaded ${TEXTURE_FILES[name]}`);
+      return name;
+    } catch (error) {
+      lastError = error;
+    }
+  }
+  await fs.rm(srcPath, { force: true });
+  throw lastError;
+}
+
+/**
+ * Try to download the real source textures. The eoimages host is slow
+ * to first byte, so the downloads run in parallel: wall time is the
+ * slowest single download instead of the sum. Returns the names that
+ * succeeded; the rest are generated procedurally.
+ */
+async function downloadRealTextures(skip = new Set()) {
+  console.log('  🌐 Downloading NASA source textures...');
+
+  const entries = Object.entries(TEXTURE_SOURCES)
+    .filter(([name]) => !skip.has(name));
+  const results = await Promise.allSettled(
+    entries.map(([name, urls]) => downloadTexture(name, urls))
+  );
+
+  const downloaded = new Set();
+  results.forEach((result, i) => {
+    if (result.status === 'fulfilled') {
+      downloaded.add(result.value);
+    } else {
+      console.log(`  ⚠️  ${entries[i][0]} download failed (${result.reason.message}), will generate procedurally`);
+    }
+  });
+  return downloaded;
+}
+
+// Texture builders by name, used by the worker-thread entry point
+const BUILDERS = {
+  day: createDayTexture,
+  night: createNightTexture,
+  specular: createSpecularTexture,
+  clouds: createCloudsTexture,
+  normal: createNormalTexture
+};
+
+/**
+ * Run one texture builder in a worker thread. The pixel loops are pure
+ * CPU work, so spreading the four textures across cores cuts wall time
+ * to roughly the slowest single texture. The result buffer is
+ * transferred, not copied.
+ */
+function buildInWorker(texture) {
+  return new Promise((resolve, reject) => {
+    const worker = new Worker(fileURLToPath(import.meta.url), {
+      workerData: { texture }
+    });
+    worker.once('message', (pixels) => {
+      resolve(Buffer.from(pixels.buffer, pixels.byteOffset, pixels.byteLength));
+    });
+    worker.once('error', reject);
+  });
+}
+
+// Worker entry point: build the requested texture and hand it back
+if (!isMainThread && workerData && workerData.texture) {
+  const pixels = BUILDERS[workerData.texture]();
+  parentPort.postMessage(pixels, [pixels.buffer]);
+}
+
+async function saveTexture(buffer, channels, filename, options = {}) {
+  const outputPath = path.join(TEXTURE_DIR, filename);
+  let pipeline = sharp(buffer, {
+    raw: { width: options.width || WIDTH, height: options.height || HEIGHT, channels }
+  });
+
+  if (filename.endsWith('.png')) {
+    pipeline = pipeline.png();
+  } else {
+    // Clouds are alpha-blended in the shader from the red channel,
+    // so flatten against black when encoding to JPEG
+    pipeline = pipeline
+      .flatten({ background: '#000000' })
+      .jpeg(options.jpeg || { quality: 90, progressive: false });
+  }
+
+  await pipeline.toFile(outputPath);
+  console.log(`  ✅ Saved ${filename}`);
+}
+
+/**
+ * A texture counts as present only if the file exists AND is non-empty:
+ * the repo ships 0-byte placeholders for these paths, and an aborted
+ * download can leave a truncated-but-empty file behind.
+ */
+async function textureOnDisk(name) {
+  try {
+    const stats = await fs.stat(path.join(TEXTURE_DIR, TEXTURE_FILES[name]));
+    return stats.size > 0;
+  } catch {
+    return false;
+  }
+}
+
+async function generateEarthTextures({ force = false } = {}) {
+  console.log('🌍 Generating Earth textures...\n');
+
+  await fs.mkdir(TEXTURE_DIR, { recursive: true });
+
+  // Skip textures already on disk from an earlier run - downloading
+  // and regenerating them is the expensive part of this script. Pass
+  // --force (or force: true) to rebuild everything.
+  const existing = new Set();
+  if (!force) {
+    for (const name of Object.keys(TEXTURE_FILES)) {
+      if (await textureOnDisk(name)) {
+        existing.add(name);
+        console.log(`  ⏭️  ${TEXTURE_FILES[name]} already exists, skipping`);
+      }
+    }
+  }
+
+  // Prefer real NASA imagery; fall back to the procedural builders for
+  // whatever failed to download (specular is always procedural)
+  const downloaded = await downloadRealTextures(existing);
+  const needed = Object.keys(TEXTURE_FILES).filter(
+    name => !downloaded.has(name) && !existing.has(name)
+  );
+
+  const generated = await Promise.all(needed.map(name => buildInWorker(name)));
+
+  for (let i = 0; i < needed.length; i++) {
+    const name = needed[i];
+    await saveTexture(generated[i], name === 'clouds' ? 4 : 3, TEXTURE_FILES[name], {
+      jpeg: JPEG_OPTIONS[name]
+    });
+  }
+
+  // Keep the PNG variant of the cloud layer in sync with the JPEG
+  // whenever the clouds were rebuilt this run (a skipped clouds
+  // texture means the PNG from the earlier run is still current)
+  const cloudsIndex = needed.indexOf('clouds');
+  if (cloudsIndex !== -1) {
+    await saveTexture(generated[cloudsIndex], 4, 'earth_clouds.png');
+  } else if (downloaded.has('clouds')) {
+    await sharp(path.join(TEXTURE_DIR, 'earth_clouds.jpg'))
+      .png()
+      .toFile(path.join(TEXTURE_DIR, 'earth_clouds.png'));
+  }
+
+  console.log('\n✅ Earth textures generated');
+}
+
+// Run if called directly (worker threads re-enter this module)
+if (isMainThread && import.meta.url === `file://${process.argv[1]}`) {
+  generateEarthTextures({ force: process.argv.includes('--force') })
+    .catch(console.error);
+}
+
+export default generateEarthTextures;
@@ -7,7 +7,10 @@
  */
 
 import fs from 'fs/promises';
+import http from 'http';
+import https from 'https';
 import path from 'path';
+import { createHash } from 'crypto';
 import { fileURLToPath } from 'url';
 import axios from 'axios';
 import dotenv from 'dotenv';
@@ -16,6 +19,91 @@ dotenv.config();
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
+// One keep-alive client for the paginated NPS crawl: every page hits
+// the same host, so reusing the TCP+TLS connection saves a handshake
+// per page
+const npsClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true }),
+  httpsAgent: new https.Agent({ keepAlive: true }),
+  timeout: 30000
+});
+
+// Transient failures (429 and 5xx, or a dropped connection) get a few
+// retries with exponential backoff before the crawl falls back to the
+// hardcoded park list
+const RETRYABLE_STATUS = new Set([429, 500, 502, 503, 504]);
+
+async function getWithRetry(url, config, attempts = 3) {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await npsClient.get(url, config);
+    } catch (error) {
+      const status = error.response ? error.response.status : null;
+      const retryable = status === null || RETRYABLE_STATUS.has(status);
+      if (!retryable || attempt >= attempts - 1) throw error;
+      await new Promise(resolve => setTimeout(resolve, 500 * 2 ** attempt));
+    }
+  }
+}
+
+// On-disk cache for NPS API responses. Park metadata changes rarely;
+// without this every run replays the full paginated crawl (plus its
+// rate-limit sleeps) for identical data.
+const CACHE_DIR = path.join(__dirname, '../.cache/nps');
+const CACHE_TTL_MS = 7 * 24 * 60 * 60 * 1000; // 7 days
+
+async function cachedGet(url, params) {
+  const key = createHash('blake2b512')
+    .update(url + JSON.stringify(params))
+    .digest('hex')
+    .slice(0, 16);
+  const cachePath = path.join(CACHE_DIR, `${key}.json`);
+
+  // Cache entries carry the response validators alongside the body so
+  // stale entries can be revalidated instead of refetched
+  let cached = null;
+  try {
+    const parsed = JSON.parse(await fs.readFile(cachePath, 'utf-8'));
+    cached = 'body' in parsed ? parsed : { body: parsed };
+    const stats = await fs.stat(cachePath);
+    if (Date.now() - stats.mtimeMs < CACHE_TTL_MS) {
+      return { data: cached.body, fromCache: true };
+    }
+  } catch (e) {
+    // Cache miss
+  }
+
+  const headers = {};
+  if (cached) {
+    if (cached.etag) headers['If-None-Match'] = cached.etag;
+    if (cached.lastModified) headers['If-Modified-Since'] = cached.lastModified;
+  }
+
+  const response = await getWithRetry(url, {
+    params,
+    headers,
+    validateStatus: status => status === 200 || status === 304
+  });
+
+  await fs.mkdir(CACHE_DIR, { recursive: true });
+
+  if (response.status === 304) {
+    // Upstream unchanged: a 304 carries no body and doesn't count
+    // against the API quota the way a full fetch does. Refresh the
+    // entry's TTL and serve the copy we already have.
+    const now = new Date();
+    await fs.utimes(cachePath, now, now);
+    return { data: cached.body, fromCache: true };
+  }
+
+  await fs.writeFile(cachePath, JSON.stringify({
+    etag: response.headers.etag || null,
+    lastModified: response.headers['last-modified'] || null,
+    body: response.data
+  }));
+  return { data: response.data, fromCache: false };
+}
+
 // Mascot information for each park
 const PARK_MASCOTS = {
   yose: {
@@ -216,15 +304,13 @@ async function fetchAllUSParks() {
   
   try {
     while (true) {
-      const response = await axios.get('https://developer.nps.gov/api/v1/parks', {
-        params: {
-          api_key: npsApiKey,
-          limit: limit,
-          start: start,
-          fields: 'images,addresses,contacts,entranceFees,activities,topics,operatingHours'
-        }
+      const response = await cachedGet('https://developer.nps.gov/api/v1/parks', {
+        api_key: npsApiKey,
+        limit: limit,
+        start: start,
+        fields: 'images,addresses,contacts,entranceFees,activities,topics,operatingHours'
       });
-      
+
       const parks = response.data.data;
       if (parks.length === 0) break;
       
@@ -250,7 +336,14 @@ async function fetchAllUSParks() {
           activities: park.activities.slice(0, 5).map(a => a.name),
           description: park.description,
           weatherInfo: park.weatherInfo,
-          images: park.images.slice(0, 5)
+          // Keep only the image fields the gallery step reads; the
+          // raw NPS records also carry title/caption/altText, which
+          // would otherwise be serialized into parks.json for every
+          // park
+          images: park.images.slice(0, 5).map(img => ({
+            url: img.url,
+            credit: img.credit
+          }))
         });
       });
       
@@ -259,8 +352,11 @@ async function fetchAllUSParks() {
       start += limit;
       if (parks.length < limit) break;
       
-      // Rate limiting - wait 1 second between requests
-      await new Promise(resolve => setTimeout(resolve, 1000));
+      // Rate limiting - wait 1 second between requests, but never
+      // throttle pages served from the local cache
+      if (!response.fromCache) {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+      }
     }
     
     console.log(`✅ Fetched ${allParks.length} US National Parks`);
@@ -350,9 +446,80 @@ function generateDefaultMascot(park) {
   };
 }
 
-async function generateStaticData() {
+/**
+ * Write a file atomically: write to a temp path in the same directory,
+ * then rename over the target. rename() is atomic on POSIX, so a build
+ * killed mid-write can never leave a torn parks.json or manifest for
+ * the dev server to hand out - readers see the old file or the new
+ * one, nothing in between.
+ */
+export async function writeFileAtomic(filePath, data) {
+  const tmpPath = `${filePath}.tmp`;
+  await fs.writeFile(tmpPath, data);
+  await fs.rename(tmpPath, filePath);
+}
+
+/**
+ * Write the artifacts derived from the final park list: the search
+ * index and the manifest. Split out so the full build can defer them
+ * until after gallery enrichment, rather than indexing park data that
+ * is still going to change. The full build passes its single run
+ * timestamp as generatedAt so every artifact agrees on when the build
+ * happened.
+ */
+export async function writeDerivedIndexes(parks, outputDir, generatedAt = new Date().toISOString()) {
+  // Generate search index
+  const searchIndex = parks.map(park => ({
+    id: park.id,
+    name: park.name,
+    code: park.code,
+    country: park.country,
+    biome: park.biome,
+    activities: park.activities,
+    searchText: `${park.name} ${park.country} ${park.biome} ${(park.activities || []).join(' ')}`
+  }));
+
+  // Prebuilt filter buckets: biome/country filters are the common list
+  // queries, and shipping the buckets lets clients answer them with a
+  // key lookup instead of scanning the whole index per filter
+  const byBiome = {};
+  const byCountry = {};
+  for (const park of parks) {
+    (byBiome[park.biome] ||= []).push(park.id);
+    (byCountry[park.country] ||= []).push(park.id);
+  }
+
+  await writeFileAtomic(
+    path.join(outputDir, 'search-index.json'),
+    JSON.stringify({ parks: searchIndex, byBiome, byCountry })
+  );
+
+  // Update the manifest in place: in the full build this runs after
+  // the terrain step has merged per-park entries (terrainFiles,
+  // textures) into manifest.json, and those must survive this write
+  const manifestPath = path.join(outputDir, 'manifest.json');
+  let manifest = {};
+  try {
+    manifest = JSON.parse(await fs.readFile(manifestPath, 'utf-8'));
+  } catch (e) {
+    // Manifest doesn't exist yet
+  }
+
+  manifest.version = '1.0.0';
+  manifest.generated = generatedAt;
+  manifest.parksCount = parks.length;
+  manifest.dataFiles = {
+    parks: '/data/parks.json',
+    search: '/data/search-index.json',
+    globe: '/data/globe/world-mesh.draco'
+  };
+
+  await writeFileAtomic(manifestPath, JSON.stringify(manifest));
+}
+
+async function generateStaticData({ writeIndexes = true } = {}) {
   console.log('🚀 Generating static park data for frontend...\n');
-  
+
   const outputDir = path.join(__dirname, '../../client/public/data');
   await fs.mkdir(outputDir, { recursive: true });
   
@@ -446,31 +613,25 @@ async function generateStaticData() {
   
   console.log(`📊 Total parks: ${finalParks.length} (${usParks.length} US, ${finalParks.length - usParks.length} International)`);
   
-  // Generate full parks list with gallery images and mascots
+  // Generate full parks list with gallery images and mascots. The
+  // placeholder hash is a canonical BlurHash string (~28 bytes per
+  // image in parks.json, versus the ~1 KB base64 JPEG stub it
+  // replaces); the image pipeline overwrites it with a real per-image
+  // hash when galleries are processed.
+  const PLACEHOLDER_BLUR_HASH = 'L6Pj0^i_.AyE_3t7t7R**0o#DgR4';
+
   const parks = finalParks.map(park => ({
     ...park,
     summary: park.description || `${park.name} is renowned for its stunning natural beauty and diverse ecosystems.`,
     gallery: park.images ? park.images.slice(0, 3).map(img => ({
       url: img.url,
-      blur: 'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQ==',
+      blurHash: PLACEHOLDER_BLUR_HASH,
       attribution: img.credit || 'National Park Service'
-    })) : [
-      {
-        url: `/images/parks/${park.code}/1.jpg`,
-        blur: 'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQ==',
-        attribution: park.country === 'USA' ? 'National Park Service' : 'Park Authority'
-      },
-      {
-        url: `/images/parks/${park.code}/2.jpg`,
-        blur: 'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQ==',
-        attribution: park.country === 'USA' ? 'National Park Service' : 'Park Authority'
-      },
-      {
-        url: `/images/parks/${park.code}/3.jpg`,
-        blur: 'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQ==',
-        attribution: park.country === 'USA' ? 'National Park Service' : 'Park Authority'
-      }
-    ],
+    })) : [1, 2, 3].map(n => ({
+      url: `/images/parks/${park.code}/${n}.jpg`,
+      blurHash: PLACEHOLDER_BLUR_HASH,
+      attribution: park.country === 'USA' ? 'National Park Service' : 'Park Authority'
+    })),
     satellite: `/images/parks/${park.code}/satellite.jpg`,
     climate: park.weatherInfo || 'Varies by season',
     nasa_validated: park.country === 'USA',
@@ -478,58 +639,44 @@ async function generateStaticData() {
   }));
   
   // Save as parks.json (this is what the frontend expects)
-  await fs.writeFile(
+  await writeFileAtomic(
     path.join(outputDir, 'parks.json'),
-    JSON.stringify({ parks }, null, 2)
+    JSON.stringify({ parks })
   );
   
-  // Also save individual park files for detail views
-  for (const park of parks) {
-    const parkDir = path.join(outputDir, 'parks', park.code);
-    await fs.mkdir(parkDir, { recursive: true });
-    
-    await fs.writeFile(
-      path.join(parkDir, 'info.json'),
-      JSON.stringify(park, null, 2)
-    );
-  }
-  
-  // Generate search index
-  const searchIndex = parks.map(park => ({
-    id: park.id,
-    name: park.name,
-    code: park.code,
-    country: park.country,
-    biome: park.biome,
-    activities: park.activities,
-    searchText: `${park.name} ${park.country} ${park.biome} ${(park.activities || []).join(' ')}`
-  }));
-  
-  await fs.writeFile(
-    path.join(outputDir, 'search-index.json'),
-    JSON.stringify(searchIndex, null, 2)
-  );
-  
-  // Generate manifest
-  const manifest = {
-    version: '1.0.0',
-    generated: new Date().toISOString(),
-    parksCount: parks.length,
-    dataFiles: {
-      parks: '/data/parks.json',
-      search: '/data/search-index.json',
-      globe: '/data/globe/world-mesh.draco'
+  // Also save individual park files for detail views. Writing 200
+  // files one at a time serializes on per-file fsync latency; a small
+  // worker pool keeps the disk queue full and amortizes that cost
+  // across the batch.
+  const writeConcurrency = 16;
+  let nextPark = 0;
+  const writeWorker = async () => {
+    while (nextPark < parks.length) {
+      const park = parks[nextPark++];
+      const parkDir = path.join(outputDir, 'parks', park.code);
+      await fs.mkdir(parkDir, { recursive: true });
+
+      await writeFileAtomic(
+        path.join(parkDir, 'info.json'),
+        JSON.stringify(park)
+      );
     }
   };
+  await Promise.all(Array.from({ length: writeConcurrency }, writeWorker));
   
-  await fs.writeFile(
-    path.join(outputDir, 'manifest.json'),
-    JSON.stringify(manifest, null, 2)
-  );
-  
+  // Generate the derived indexes, unless the caller defers them to
+  // run after later enrichment steps
+  if (writeIndexes) {
+    await writeDerivedIndexes(parks, outputDir);
+  }
+
   console.log('✅ Static data generated successfully!');
   console.log(`📁 Output directory: ${outputDir}`);
   console.log(`📊 Generated ${parks.length} parks`);
+
+  // Hand the in-memory parks back so later build steps don't have to
+  // re-read and re-parse parks.json from disk
+  return parks;
 }
 
 // Run if called directly
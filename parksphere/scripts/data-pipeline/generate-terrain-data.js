@@ -11,6 +11,7 @@ import path from 'path';
 import { fileURLToPath } from 'url';
 import TerrainProcessor from './terrain-processor.js';
 import APIClient from './api-client.js';
+import { writeFileAtomic } from './generate-static-data.js';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
@@ -78,7 +79,7 @@ const PARKS = [
   }
 ];
 
-async function generateTerrainData() {
+async function generateTerrainData(generatedAt = new Date().toISOString()) {
   console.log('🏔️  Generating terrain data for all parks...\n');
   
   const terrainProcessor = new TerrainProcessor();
@@ -128,7 +129,7 @@ async function generateTerrainData() {
       
       await fs.writeFile(
         path.join(parkDir, 'textures.json'),
-        JSON.stringify(textureData, null, 2)
+        JSON.stringify(textureData)
       );
       
       // Update park info with terrain metadata
@@ -157,7 +158,7 @@ async function generateTerrainData() {
         textures: textureData
       };
       
-      await fs.writeFile(infoPath, JSON.stringify(parkInfo, null, 2));
+      await fs.writeFile(infoPath, JSON.stringify(parkInfo));
       
     } catch (error) {
       console.error(`❌ Error processing ${park.name}:`, error.message);
@@ -165,18 +166,18 @@ async function generateTerrainData() {
   }
   
   // Update manifest with park data
-  await updateManifest(PARKS);
+  await updateManifest(PARKS, generatedAt);
   
   console.log('\n✅ Terrain generation complete!');
 }
 
-async function updateManifest(parks) {
+async function updateManifest(parks, generatedAt) {
   const outputDir = path.join(__dirname, '../../client/public/data');
   const manifestPath = path.join(outputDir, 'manifest.json');
-  
+
   let manifest = {
     version: '1.0.0',
-    generated: new Date().toISOString(),
+    generated: generatedAt,
     parks: []
   };
   
@@ -218,9 +219,9 @@ async function updateManifest(parks) {
   }));
   
   // Update generated timestamp
-  manifest.generated = new Date().toISOString();
+  manifest.generated = generatedAt;
   
-  await fs.writeFile(manifestPath, JSON.stringify(manifest, null, 2));
+  await writeFileAtomic(manifestPath, JSON.stringify(manifest));
   console.log('📋 Updated manifest.json');
 }
 